@@ -10,19 +10,20 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
+import ast
 import os
 import sys
-from datetime import datetime
+import time
 sys.path.insert(0, os.path.abspath('..'))
 
 version_file = '../utilsd/__init__.py'
 
 def get_version(rel_path):
+    # The file can't be imported with importlib directly because of the relative imports in it.
     with open(rel_path) as f:
-        for line in f.readlines():
+        for line in f:
             if line.startswith('__version__'):
-                delim = '"' if '"' in line else "'"
-                return line.split(delim)[1]
+                return ast.literal_eval(line.split('=', 1)[1].strip())
     raise RuntimeError("Unable to find version string.")
 
 __version__ = get_version(version_file)
@@ -30,7 +31,7 @@ __version__ = get_version(version_file)
 # -- Project information -----------------------------------------------------
 
 project = 'utilsd'
-copyright = f'{datetime.now().year}, Yuge Zhang'
+copyright = f'{time.gmtime().tm_year}, Yuge Zhang'
 author = 'utilsd dev'
 version = __version__
 release = __version__
@@ -51,13 +52,21 @@ templates_path = ['_templates']
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store', '.ipynb_checkpoints']
+exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store', '.ipynb_checkpoints', 'tutorials/assets']
+
+# Notebooks are committed with their outputs. Never re-execute them on build,
+# so that incremental builds only re-render the pages that actually changed.
+nbsphinx_execute = 'never'
+nbsphinx_allow_errors = False
 
 # The master toctree document.
 master_doc = 'index'
 
 # -- Options for HTML output -------------------------------------------------
 
+# NOTE: keep all the values below plain str / list / dict.
+# Unpicklable config values invalidate Sphinx's environment cache and force a full rebuild.
+
 # The theme to use for HTML and HTML Help pages.  See the documentation for
 # a list of builtin themes.
 #
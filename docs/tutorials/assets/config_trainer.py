@@ -23,5 +23,7 @@ class TrainerConfig:
     batch_size: int
     fast_dev_run: bool = False
 
-config = TrainerConfig.fromcli()
-print(config)
+
+if __name__ == '__main__':
+    config = TrainerConfig.fromcli()
+    print(config)
@@ -1,2 +1,19 @@
+from utilsd.config import SubclassConfig, configclass
+
+
 class BaseBar:
     pass
+
+
+class BaseFoo:
+    pass
+
+
+class SubFoo(BaseFoo):
+    pass
+
+
+@configclass
+class CfgWithSubclass:
+    n: SubclassConfig[BaseFoo]
+    t: SubclassConfig[BaseBar]
@@ -1,17 +1,11 @@
 import os
+from collections import OrderedDict
 from typing import Optional, Union
 
-from utilsd.config import PythonConfig, Registry, RegistryConfig, SubclassConfig, configclass
+import pytest
+from utilsd.config import PythonConfig, Registry, RegistryConfig, configclass
 from unittest.mock import patch
-from tests.assets.import_class import BaseBar
-
-
-class BaseFoo:
-    pass
-
-
-class SubFoo(BaseFoo):
-    pass
+from tests.assets.import_class import BaseFoo, CfgWithSubclass
 
 
 @configclass
@@ -26,12 +20,6 @@ class Foo:
     c: Bar
 
 
-@configclass
-class CfgWithSubclass:
-    n: SubclassConfig[BaseFoo]
-    t: SubclassConfig[BaseBar]
-
-
 class TEST(metaclass=Registry, name="test"):
     pass
 
@@ -54,52 +42,70 @@ class ConfWithBool:
     act: bool
 
 
-def test_parse_command_line():
-    config_fp = os.path.join(os.path.dirname(__file__), 'assets/exp_config.yml')
-    with patch('argparse._sys.argv', ['test.py', config_fp]):
-        assert Foo.fromcli().b == 2.0
-    with patch('argparse._sys.argv', ['test.py', config_fp, '--b', '3']):
+def _asset_path(name):
+    return os.path.join(os.path.dirname(__file__), 'assets', name)
+
+
+@pytest.mark.parametrize('argv, expected', [
+    ([], {'b': 2.0}),
+    (['--b', '3'], {'b': 3}),
+    (['--c.n', '1'], {'c.n': 1}),
+])
+def test_parse_command_line(argv, expected):
+    config = Foo.fromcli([_asset_path('exp_config.yml')] + argv)
+    for key, value in expected.items():
+        obj = config
+        for k in key.split('.'):
+            obj = getattr(obj, k)
+        assert obj == value
+
+
+def test_parse_command_line_sys_argv():
+    # read from sys.argv by default
+    with patch('argparse._sys.argv', ['test.py', _asset_path('exp_config.yml'), '--b', '3']):
         assert Foo.fromcli().b == 3
-    with patch('argparse._sys.argv', ['test.py', config_fp, '--c.n', '1']):
-        assert Foo.fromcli().c.n == 1
 
 
 def test_cli_with_bool():
-    config_fp = os.path.join(os.path.dirname(__file__), 'assets/exp_config_bool.yml')
-    with patch('argparse._sys.argv', ['test.py', config_fp]):
-        assert ConfWithBool.fromcli().act == False
-    with patch('argparse._sys.argv', ['test.py', config_fp, '--act', 'true']):
-        assert ConfWithBool.fromcli().act == True
-    with patch('argparse._sys.argv', ['test.py', config_fp, '-a', 'true']):
-        assert ConfWithBool.fromcli(shortcuts={'act': ['-a']}).act == True
+    config_fp = _asset_path('exp_config_bool.yml')
+    assert ConfWithBool.fromcli([config_fp]).act == False
+    assert ConfWithBool.fromcli([config_fp, '--act', 'true']).act == True
+    assert ConfWithBool.fromcli([config_fp, '-a', 'true'], shortcuts={'act': ['-a']}).act == True
+    assert ConfWithBool.fromcli([config_fp, '--act', 'false']).act == False
 
 
 def test_parse_command_line_dynamic():
-    config_fp = os.path.join(os.path.dirname(__file__), 'assets/exp_config_subclass.yml')
-    with patch('argparse._sys.argv', ['test.py', config_fp]):
-        assert CfgWithSubclass.fromcli().t.build().a == 1
-    with patch('argparse._sys.argv', ['test.py', config_fp, '--t.a', '2']):
-        assert CfgWithSubclass.fromcli().t.build().a == 2
+    config_fp = _asset_path('exp_config_subclass.yml')
+    assert CfgWithSubclass.fromcli([config_fp]).t.build().a == 1
+    assert CfgWithSubclass.fromcli([config_fp, '--t.a', '2']).t.build().a == 2
 
 
 def test_registry_config_command_line():
-    config_fp = os.path.join(os.path.dirname(__file__), 'assets/registry1.yml')
-    with patch('argparse._sys.argv', ['test.py', config_fp, '--test.a', '2']):
-        config = RegistryModuleConfig.fromcli()
-        assert config.test.a == 2
+    config_fp = _asset_path('registry1.yml')
+    config = RegistryModuleConfig.fromcli([config_fp, '--test.a', '2'])
+    assert config.test.a == 2
 
     # test optional int, default = None
-    with patch('argparse._sys.argv', ['test.py', config_fp, '--test.b', 'test']):
-        config = RegistryModuleConfig.fromcli()
-        assert config.test.b == 'test'
+    config = RegistryModuleConfig.fromcli([config_fp, '--test.b', 'test'])
+    assert config.test.b == 'test'
 
     # test json
-    with patch('argparse._sys.argv', ['test.py', config_fp, '--test', '{"a": 42, "b": "abc"}']):
-        config = RegistryModuleConfig.fromcli()
-        assert config.test.a == 42
-        assert config.test.b == 'abc'
+    config = RegistryModuleConfig.fromcli([config_fp, '--test', '{"a": 42, "b": "abc"}'])
+    assert config.test.a == 42
+    assert config.test.b == 'abc'
 
 
 if __name__ == '__main__':
     # test_cli_with_bool()
     test_registry_config_command_line()
+
+
+def test_cli_parser_cache_bounded(monkeypatch):
+    from utilsd.config import python, type_def
+
+    monkeypatch.setattr(type_def, '_HANDLER_CACHE_SIZE', 2)
+    monkeypatch.setattr(python, '_cli_parser_cache', OrderedDict())
+    config_fp = _asset_path('exp_config_bool.yml')
+    for i in range(4):
+        assert ConfWithBool.fromcli([config_fp, f'--act{i}', 'true'], shortcuts={'act': [f'--act{i}']}).act == True
+    assert len(python._cli_parser_cache) == 2
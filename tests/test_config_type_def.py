@@ -1,5 +1,6 @@
 import os
 import pathlib
+import sys
 import typing
 from dataclasses import dataclass
 from enum import Enum
@@ -47,6 +48,12 @@ def test_optional():
         TypeDef.load(typing.Optional[int], 1.5)
     assert TypeDef.dump(typing.Optional[int], None) == None
     assert TypeDef.dump(typing.Optional[int], 2) == 2
+    assert TypeDef.load(typing.Union[None, int], 2) == 2
+    assert TypeDef.load(typing.Union[None, int], None) == None
+    if sys.version_info >= (3, 10):
+        assert TypeDef.load(eval('int | None'), 2) == 2
+        assert TypeDef.load(eval('int | None'), None) == None
+        assert TypeDef.load(eval('int | str'), 'a') == 'a'
 
 
 def test_primitive():
@@ -69,6 +76,12 @@ def test_primitive():
     # union int float
     assert TypeDef.load(typing.Union[int, float], 2.5) == 2.5
     assert TypeDef.load(typing.List[typing.Union[int, float]], [1, 2.5]) == [1, 2.5]
+    # order of union matters, even though the unions compare equal
+    assert isinstance(TypeDef.load(typing.Union[int, float], 1), int)
+    assert isinstance(TypeDef.load(typing.Union[float, int], 1), float)
+    assert TypeDef.load(typing.Union[int, str], 2.5) == '2.5'
+    with pytest.raises(ValidationError, match='are exhausted'):
+        TypeDef.load(typing.Union[int, float], [1])
 
 
 def test_list():
@@ -77,12 +90,19 @@ def test_list():
     assert TypeDef.load(typing.List[pathlib.Path], ['/bin', '/etc']) == \
         [pathlib.Path('/bin'), pathlib.Path('/etc')]
     assert TypeDef.load(typing.List[typing.List[int]], [[1, 2], [1, 2]]) == [[1, 2], [1, 2]]
+    plain = [1, 2, 3]
+    loaded = TypeDef.load(typing.List[int], plain)
+    assert loaded == plain and loaded is not plain
+    assert TypeDef.load(typing.List[int], [1, '2']) == [1, 2]
 
     with pytest.raises(ValidationError, match='index:0'):
         TypeDef.load(typing.List[typing.List[int]], [1, 2])
 
     assert TypeDef.dump(typing.List[typing.Tuple[str, str]], [('a', 'b'), ('a', 'c')]) == \
         [('a', 'b'), ('a', 'c')]
+    assert TypeDef.dump(typing.List[pathlib.Path], [pathlib.Path('/bin')]) == ['/bin']
+    with pytest.raises(ValidationError, match='index:1'):
+        TypeDef.dump(typing.List[int], [1, 2.0])
 
 
 def test_tuple():
@@ -98,6 +118,9 @@ def test_tuple():
 
 def test_dict():
     assert TypeDef.load(typing.Dict[str, int], {'a': 1, 'b': 2}) == {'a': 1, 'b': 2}
+    assert TypeDef.load(typing.Dict[str, int], {'a': '1'}) == {'a': 1}
+    assert TypeDef.load(typing.Dict[str, float], {'a': 1}) == {'a': 1.}
+    assert TypeDef.load(typing.Dict[int, str], {'1': 'a'}) == {1: 'a'}
     with pytest.raises(ValidationError, match='Expect a dict'):
         TypeDef.load(typing.Dict[str, int], [('a', 1), ('b', 2)])
 
@@ -122,6 +145,7 @@ def test_enum():
         state2 = 'state2_val'
 
     assert TypeDef.load(MyEnum, 'state2_val') == MyEnum.state2
+    assert TypeDef.load(MyEnum, MyEnum.state1) is MyEnum.state1
     assert TypeDef.dump(MyEnum, MyEnum.state1) == 'state1_val'
     with pytest.raises(ValidationError, match='is not a valid'):
         TypeDef.load(MyEnum, 'other')
@@ -149,6 +173,8 @@ def test_dataclass():
 
     with pytest.raises(ValidationError, match='not set'):
         TypeDef.load(Foo, dict(a=1, c={'n': 0}))
+    with pytest.raises(ValidationError, match='Unrecognized fields d, e'):
+        TypeDef.load(Foo, dict(a=1, b=2.0, d=1, c={'n': 0}, e=2, _meta={}))
 
     assert TypeDef.load(Foo, dict(a=1, b=2.0, c={'n': 0},
                                   _meta={'a': 42}))._meta == {'a': 42}
@@ -184,6 +210,50 @@ def test_dataclass():
 
     assert TypeDef.load(Foo, dict(a=1, b=1)).a == 1
 
+    @dataclass
+    class Foo:
+        a: int
+        b: int = 0
+
+        def __post_init__(self):
+            self.b = self.a * 2
+
+    foo = TypeDef.load(Foo, dict(a=1))
+    assert foo.b == 2 and foo == Foo(a=1)
+
+    # string annotations, as with `from __future__ import annotations`
+    @dataclass
+    class Foo:
+        a: 'int'
+        b: 'typing.List[float]'
+
+    foo = TypeDef.load(Foo, dict(a=1, b=[2]))
+    assert foo.a == 1 and foo.b == [2.0]
+    assert TypeDef.dump(Foo, foo) == {'a': 1, 'b': [2.0]}
+
+    # the inherited __init__ doesn't accept the fields of the subclass
+    @dataclass
+    class Foo:
+        a: int
+
+    @dataclass(init=False)
+    class FooNoInit(Foo):
+        b: int = 0
+
+    with pytest.raises(ValidationError, match="unexpected keyword argument 'b'"):
+        TypeDef.load(FooNoInit, dict(a=1, b=2))
+
+    @dataclass
+    class FooWithNew:
+        a: int
+
+        def __new__(cls, a):
+            inst = super().__new__(cls)
+            inst.created_by_new = True
+            return inst
+
+    assert TypeDef.load(FooWithNew, dict(a=1)).created_by_new
+
 
 def test_union():
     @dataclass
@@ -194,6 +264,8 @@ def test_union():
     assert TypeDef.load(typing.Union[pathlib.Path, Foo], {'bar': 2}).bar == 2
     assert TypeDef.load(typing.Union[str, typing.Tuple[str, str]], ['1', '2']) == ('1', '2')
     assert TypeDef.load(typing.Union[pathlib.Path, None], None) == None
+    assert TypeDef.load(typing.Union[typing.Dict[str, int], typing.List[int]], [1]) == [1]
+    assert TypeDef.load(typing.Union[None, Foo, pathlib.Path], '/bin') == pathlib.Path('/bin')
 
     assert TypeDef.load(typing.Union[typing.List[int], typing.List[float]], [1, 2.5, '3']) == [1, 2.5, 3]
     with pytest.raises(ValidationError, match='are exhausted'):
@@ -246,6 +318,8 @@ def test_class_config():
     assert TypeDef.load(ClassConfig[module], {'a': 1, 'b': 2}).a == 1
     assert TypeDef.load(ClassConfig[module], {'a': 1, 'b': 2}).type() == module
     assert TypeDef.load(ClassConfig[module], {'a': 1, 'b': 2}).build()._a == 1
+    # every mention of ClassConfig[module] shares the handler, as well as the generated dataclass
+    assert TypeDef._find_handler(ClassConfig[module])[0] is TypeDef._find_handler(ClassConfig[module])[0]
 
     result = TypeDef.load(ClassConfig[module], {'a': 1, 'b': 2})
     assert isinstance(result, ClassConfig)
@@ -293,3 +367,43 @@ def test_class_config():
     assert TypeDef.load(ClassConfig[module],
                         {'a': {'a': 1, 'b': 2}, 'b': {'a': 3, 'b': 4, 'c': 5}}).build().b._c == 5
 
+
+
+def test_handler_cache_invalidation():
+    from utilsd.config.type_def import TypeDefRegistry
+
+    class Marker:
+        pass
+
+    def marker_def(loaded):
+        class MarkerDef(TypeDef):
+            @classmethod
+            def new(cls, type_):
+                return cls(type_) if type_ is Marker else None
+
+            def validate(self, converted, ctx):
+                pass
+
+            def from_plain(self, plain, ctx):
+                return loaded
+
+        return MarkerDef
+
+    TypeDefRegistry.register_module('marker', module=marker_def(1))
+    try:
+        assert TypeDef.load(Marker, 'x') == 1
+        # same number of type defs, but a different one
+        TypeDefRegistry.unregister_module('marker')
+        TypeDefRegistry.register_module('marker', module=marker_def(2))
+        assert TypeDef.load(Marker, 'x') == 2
+    finally:
+        TypeDefRegistry.unregister_module('marker')
+
+
+def test_handler_cache_bounded():
+    from utilsd.config import type_def
+
+    for i in range(type_def._HANDLER_CACHE_SIZE + 10):
+        TypeDef._find_handler(typing.List[type(f'Local{i}', (), {})])
+    assert len(type_def._handler_cache) <= type_def._HANDLER_CACHE_SIZE
+    assert len(type_def._handler_cache_by_id) <= type_def._HANDLER_CACHE_SIZE
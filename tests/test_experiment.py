@@ -0,0 +1,29 @@
+import json
+import math
+import os
+
+from utilsd.config import configclass
+from utilsd.experiment import print_config
+
+
+@configclass
+class _FloatConfig:
+    a: float
+    b: float
+    c: float
+
+
+def test_print_config_non_finite(tmp_path):
+    print_config({'a': float('inf'), 'b': float('nan')}, output_dir=tmp_path, expand_config=False)
+    with open(os.path.join(tmp_path, 'config.json')) as fh:
+        config = json.load(fh)
+    assert config['a'] == float('inf')
+    assert math.isnan(config['b'])
+
+    print_config(_FloatConfig(a=float('inf'), b=float('-inf'), c=float('nan')), output_dir=tmp_path)
+    with open(os.path.join(tmp_path, 'config.json')) as fh:
+        config = json.load(fh)
+    assert config['a'] == float('inf')
+    assert config['b'] == float('-inf')
+    assert math.isnan(config['c'])
+    assert os.path.exists(os.path.join(tmp_path, 'config_meta.json'))
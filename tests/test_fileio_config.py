@@ -6,12 +6,14 @@ import os
 import os.path as osp
 import shutil
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 import yaml
 
 from utilsd.fileio import Config, DictAction, dump, load
+from utilsd.fileio import config as config_module
 
 data_path = osp.join(osp.dirname(__file__), 'assets/fileio_config')
 
@@ -172,6 +174,87 @@ def test_fromfile():
         Config.fromfile(osp.join(data_path, 'color.jpg'))
 
 
+def test_fromfile_cache(monkeypatch):
+    with tempfile.TemporaryDirectory() as temp_config_dir:
+        cfg_file = osp.join(temp_config_dir, 'cache.yaml')
+        with open(cfg_file, 'w') as f:
+            yaml.dump(dict(item1=[1, 2], item2=dict(a=0)), f)
+        cfg = Config.fromfile(cfg_file)
+        cfg.merge_from_dict({'item2.a': 1})
+        # modification on loaded config doesn't affect the next load
+        assert Config.fromfile(cfg_file).item2.a == 0
+
+        with open(cfg_file, 'w') as f:
+            yaml.dump(dict(item1=[1, 2, 3], item2=dict(a=0)), f)
+        assert Config.fromfile(cfg_file).item1 == [1, 2, 3]
+
+        # merging with base doesn't modify the cached config
+        with open(osp.join(temp_config_dir, 'child.yaml'), 'w') as f:
+            yaml.dump(dict(_base_='cache.yaml', item2=dict(_delete_=True, b=1)), f)
+        for _ in range(2):
+            cfg = Config.fromfile(osp.join(temp_config_dir, 'child.yaml'))
+            assert cfg.item2 == dict(b=1)
+
+        # the least recently used files are dropped
+        monkeypatch.setattr(config_module, '_PARSED_FILE_CACHE_SIZE', 2)
+        monkeypatch.setattr(config_module, '_parsed_file_cache', OrderedDict())
+        for i in range(3):
+            with open(osp.join(temp_config_dir, f'{i}.yaml'), 'w') as f:
+                yaml.dump(dict(i=i), f)
+            assert Config.fromfile(osp.join(temp_config_dir, f'{i}.yaml')).i == i
+        assert [key[0] for key in config_module._parsed_file_cache] == \
+            [osp.join(temp_config_dir, '1.yaml'), osp.join(temp_config_dir, '2.yaml')]
+
+
+def test_yaml_json_sidecar(monkeypatch):
+    monkeypatch.setenv('UTILSD_YAML_CACHE', '1')
+    with tempfile.TemporaryDirectory() as temp_config_dir:
+        cfg_file = osp.join(temp_config_dir, 'sidecar.yaml')
+        sidecar_file = cfg_file + '.cache.json'
+        with open(cfg_file, 'w') as f:
+            yaml.dump(dict(item1=[1, 2], item2=dict(a=0)), f)
+        assert Config._parse_file(cfg_file)[0] == dict(item1=[1, 2], item2=dict(a=0))
+        assert osp.exists(sidecar_file)
+
+        # content is read from sidecar when it's up-to-date
+        with open(sidecar_file) as f:
+            sidecar = json.load(f)
+        sidecar['config']['item1'] = [3]
+        with open(sidecar_file, 'w') as f:
+            json.dump(sidecar, f)
+        assert Config._parse_file(cfg_file)[0]['item1'] == [3]
+
+        # outdated sidecar is ignored
+        with open(cfg_file, 'w') as f:
+            yaml.dump(dict(item1=[1, 2, 3]), f)
+        assert Config._parse_file(cfg_file)[0] == dict(item1=[1, 2, 3])
+
+        # keys that are not strings can't be stored in JSON
+        os.remove(sidecar_file)
+        with open(cfg_file, 'w') as f:
+            yaml.dump({1: 'a'}, f)
+        assert Config._parse_file(cfg_file)[0] == {1: 'a'}
+        assert not osp.exists(sidecar_file)
+
+        # predefined variables are substituted again for a copy that keeps mtime
+        with open(cfg_file, 'w') as f:
+            f.write('name: "{{ fileDirname }}"\n')
+        assert Config._parse_file(cfg_file)[0] == dict(name=temp_config_dir)
+        with tempfile.TemporaryDirectory() as copy_dir:
+            copied_file = shutil.copy2(cfg_file, copy_dir)
+            shutil.copy2(sidecar_file, copy_dir)
+            assert Config._parse_file(copied_file)[0] == dict(name=copy_dir)
+
+        # temporary file is removed when the sidecar can't be written
+        def broken_replace(src, dst):
+            raise OSError('replace failed')
+
+        os.remove(sidecar_file)
+        monkeypatch.setattr(os, 'replace', broken_replace)
+        assert Config._parse_file(cfg_file)[0] == dict(name=temp_config_dir)
+        assert os.listdir(temp_config_dir) == ['sidecar.yaml']
+
+
 def test_fromstring():
     for filename in ['a.py', 'a.b.py', 'b.json', 'c.yaml']:
         cfg_file = osp.join(data_path, filename)
@@ -1,10 +1,13 @@
+import sys
+import types
 from typing import Dict, Union
 
 import pytest
 from utilsd.config import ClassConfig, Registry, RegistryConfig, SubclassConfig, configclass
 from utilsd.config.type_def import TypeDef
 from utilsd.config.exception import ValidationError
-from tests.assets.import_class import BaseBar
+from utilsd.config.registry import dataclass_from_class
+from tests.assets.import_class import BaseBar, BaseFoo, CfgWithSubclass, SubFoo
 
 
 class Converters(metaclass=Registry, name='converter'):
@@ -25,14 +28,6 @@ class Converter2:
         self.b = b
 
 
-class BaseFoo:
-    pass
-
-
-class SubFoo(BaseFoo):
-    pass
-
-
 @configclass
 class CfgRegistryNormal:
     m: RegistryConfig[Converters]
@@ -74,12 +69,6 @@ class FooN:
     n: ClassConfig[Converter1]
 
 
-@configclass
-class CfgWithSubclass:
-    n: SubclassConfig[BaseFoo]
-    t: SubclassConfig[BaseBar]
-
-
 def test_registry_config():
     config = TypeDef.load(CfgRegistryNormal, dict(m={'type': 'Converter1', 'a': 1, 'b': 2}))
     assert config.m.a == 1
@@ -119,6 +108,38 @@ def test_registry_config_complex_subclass_union():
     assert isinstance(config.m.build().converter, SubFoo)
 
 
+def test_dataclass_from_class_reused():
+    assert dataclass_from_class(Converter1) is dataclass_from_class(Converter1)
+    assert dataclass_from_class(Converter1) is not dataclass_from_class(Converter1, inherit_signature=True)
+    assert dataclass_from_class(Converter1)(a=1, b=2).build().b == 2
+
+
+def test_subclass_config_redefined(monkeypatch):
+    module = types.ModuleType('redefined_module')
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    exec('class Base:\n    pass', module.__dict__)
+    source = 'class Sub(Base):\n    def __init__(self, a: int):\n        self.a = a'
+
+    exec(source, module.__dict__)
+    old_sub = module.Sub
+    config = TypeDef.load(SubclassConfig[module.Base], {'type': 'Sub', 'a': 1})
+    assert type(config.build()) is old_sub
+
+    # e.g., the module is reloaded, while the old class is still alive
+    exec(source, module.__dict__)
+    assert module.Sub is not old_sub
+    config = TypeDef.load(SubclassConfig[module.Base], {'type': 'Sub', 'a': 1})
+    assert type(config.build()) is module.Sub
+    assert type(config) is dataclass_from_class(module.Sub)
+    assert TypeDef.dump(SubclassConfig[module.Base], config) == {'type': 'redefined_module.Sub', 'a': 1}
+
+    # the path of a replaced class leads to the new class
+    old_config = config
+    exec(source, module.__dict__)
+    with pytest.raises(ValidationError, match='cannot be created via importing'):
+        TypeDef.dump(SubclassConfig[module.Base], old_config)
+
+
 def test_subclass_config():
     config = TypeDef.load(CfgWithSubclass, dict(
         n={'type': 'SubFoo'},
@@ -126,7 +147,7 @@ def test_subclass_config():
     ))
 
     assert TypeDef.dump(CfgWithSubclass, config) == dict(
-        n={'type': 'tests.test_registry.SubFoo'},
+        n={'type': 'tests.assets.import_class.SubFoo'},
         t={'type': 'tests.assets.import_invisible.SubBar', 'a': 1}
     )
     assert isinstance(config.t.build(), BaseBar)
@@ -152,6 +173,26 @@ def test_registry():
     Converters.register_module(module=Converter2)
     assert len(Converters) == 2
 
+    version = Converters.version
+    Converters.register_many({'Alias1': Converter1, 'Alias2': Converter2})
+    assert Converters.get('Alias2') == Converter2
+    assert Converters.version > version
+    with pytest.raises(ValueError):
+        # registered under two names
+        Converters.inverse_get(Converter1)
+    with pytest.raises(KeyError):
+        Converters.register_many({'Alias1': Converter2})
+    Converters.unregister_module('Alias1')
+    Converters.unregister_module('Alias2')
+    assert len(Converters) == 2
+    assert Converters.inverse_get(Converter1) == 'Converter1'
+    Converters.register_module('Converter1', force=True, module=Converter2)
+    with pytest.raises(ValueError):
+        Converters.inverse_get(Converter1)
+    Converters.register_module('Converter1', force=True, module=Converter1)
+    assert Converters.inverse_get(Converter1) == 'Converter1'
+    assert Converters.inverse_get(Converter2) == 'Converter2'
+
 
 class TestInhReg(metaclass=Registry, name='TestInh'):
     pass
@@ -1,4 +1,4 @@
-from utilsd.search import Choice, sample_from, iterate_over, size
+from utilsd.search import Choice, sample_from, grid_sample_from, iterate_over, size
 
 
 def test_sample():
@@ -16,3 +16,8 @@ def test_sample():
     assert len(set([str(sample['_meta']) for sample in iterate_over(space)])) == 108
     assert len(list(iterate_over(space))) == 108
     assert len(list(iterate_over(space))) == size(space)
+
+    all_samples = [str(sample) for sample in iterate_over(space)]
+    picked = [str(sample) for sample in grid_sample_from(space, 10)]
+    assert len(set(picked)) == 10 and set(picked) <= set(all_samples)
+    assert sorted(str(sample) for sample in grid_sample_from(space, 200)) == sorted(all_samples)
@@ -4,9 +4,14 @@ import logging
 import os
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from .builtins import get_builtin_pattern
 from .pattern import Pattern
-from .pipeline import run
+from .pipeline import analyze
 from .utils import prepare_logger
 
 logger = logging.getLogger(__name__)
@@ -17,10 +22,11 @@ def main():
     parser.add_argument("config")
     parser.add_argument("--output", default=None, type=str)
     parser.add_argument("--debug", default=False, action="store_true")
+    parser.add_argument("--num-workers", default=1, type=int)
     args = parser.parse_args()
     prepare_logger(args.debug)
     with open(args.config) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     log_paths = config["logs"]
     output_path = args.output
     if output_path is None:
@@ -34,7 +40,7 @@ def main():
         patterns[name] = get_builtin_pattern(pattern_name)
     for name, pattern_dict in config.get("customPatterns", {}).items():
         patterns[name] = Pattern(pattern_dict)
-    result = run(log_paths, patterns)
+    result = analyze(log_paths, patterns, num_workers=args.num_workers)
     with open(output_path, "w") as f:
         json.dump(result, f)
 
@@ -1,7 +1,10 @@
-import json
+import ast
 import logging
+import operator
 import re
 
+from ..fileio.handlers.json_handler import json_loads
+
 
 def plugin_sequence_group(matched_results):
     last_key = None
@@ -32,8 +35,9 @@ CONVERTER_DICT = {
     "int": int,
     "float": float,
     "str": str,
-    "json": json.loads,
-    "eval": eval,
+    "json": json_loads,
+    # literals only, which is much faster than eval and doesn't execute arbitrary code from logs
+    "eval": ast.literal_eval,
     "none": None,
 }
 
@@ -52,16 +56,29 @@ class Pattern:
         self.regex = re.compile(pattern_dict["pattern"])
         self.converter = [CONVERTER_DICT[k] for k in pattern_dict["converter"]]
         assert len(self.converter) == self.regex.groups
+        # "none" converters are skipped
+        indices = [i for i, conv in enumerate(self.converter) if conv is not None]
+        self._active_converters = tuple(self.converter[i] for i in indices)
+        # picks the groups to convert from ``m.groups()``, always as a tuple
+        if len(indices) > 1:
+            self._pick_groups = operator.itemgetter(*indices)
+        elif indices:
+            self._pick_groups = operator.itemgetter(slice(indices[0], indices[0] + 1))
+        else:
+            self._pick_groups = operator.itemgetter(slice(0, 0))
         self.plugins = [PLUGIN_DICT[k] for k in pattern_dict.get("plugins", [])]
         logger.info("Found %d converters, %d plugins.", len(self.converter), len(self.plugins))
 
     def parse(self, file_content):
+        # the first match of each line is used, so lines are searched one by one
+        # use locals in the loop, as it runs for every line of the log
+        converters, pick_groups = self._active_converters, self._pick_groups
+        single = len(self.converter) == 1
         results = []
-        for line in file_content:
-            m = self.regex.search(line)
+        for m in map(self.regex.search, file_content):
             if m is not None:
-                r = [conv(m.group(i)) for i, conv in enumerate(self.converter, start=1) if conv is not None]
-                if len(self.converter) == 1:
+                r = [conv(g) for conv, g in zip(converters, pick_groups(m.groups()))]
+                if single:
                     r = r[0]
                 results.append(r)
         for plugin in self.plugins:
@@ -11,7 +11,7 @@ from collections import defaultdict
 def read_log(log_file):
     if os.path.isfile(log_file):
         with open(log_file) as f:
-            return list(f.readlines())
+            return f.readlines()
     else:
         return []
 
@@ -19,8 +19,9 @@ def read_log(log_file):
 def search_for(contents: List[str], regex: str, postproc: Union[Tuple[int, Callable], Dict[int, Callable]], keepall=False):
     # postproc should be an OrderedDict
     result = []
-    for line in contents:
-        match = re.search(regex, line)
+    # compile once, instead of looking up re's cache for every line
+    search = re.compile(regex).search
+    for match in map(search, contents):
         if match is not None:
             if isinstance(postproc, tuple):
                 found = postproc[1](match.group(postproc[0]))
@@ -19,6 +19,9 @@ class AverageMeter(object):
         >>> losses.update(loss_value, batch_size)
     """
 
+    # there can be many meters, one for each metric
+    __slots__ = ('val', 'avg', 'sum', 'count')
+
     def __init__(self):
         self.reset()
 
@@ -29,13 +32,31 @@ class AverageMeter(object):
         self.count = 0
 
     def update(self, val, n=1):
-        if hasattr(val, 'item'):
+        """Update with ``val``, the mean of ``n`` values.
+
+        Tensors and numpy scalars are converted with ``.item()``.
+        Note that this synchronizes with the device for CUDA tensors,
+        so consider accumulating on the device and updating less frequently.
+        """
+        # python numbers are the most common, skip probing them
+        if type(val) not in (float, int) and hasattr(val, 'item'):
             val = val.item()
         self.val = val
         self.sum += val * n
         self.count += n
         self.avg = self.sum / self.count
 
+    def update_batch(self, sum_val, n):
+        """Update with ``n`` values at once, given their sum (a python number).
+        ``val`` becomes the mean of the batch.
+        """
+        if n == 0:
+            return
+        self.val = sum_val / n
+        self.sum += sum_val
+        self.count += n
+        self.avg = self.sum / self.count
+
 
 class MetricMeter(object):
     """A collection of metrics.
@@ -52,6 +73,8 @@ class MetricMeter(object):
         >>> print(str(metric))
     """
 
+    __slots__ = ('meters', 'delimiter')
+
     def __init__(self, delimiter='  '):
         self.meters = defaultdict(AverageMeter)
         self.delimiter = delimiter
@@ -73,7 +96,9 @@ class MetricMeter(object):
 
         for k, v in input_dict.items():
             if isinstance(v, (Sequence, np.ndarray)):
-                self.meters[k].update(np.mean(v), np.size(v))
+                # one pass over the values, instead of mean and size separately
+                v = np.asarray(v)
+                self.meters[k].update_batch(v.sum().item(), v.size)
             else:
                 self.meters[k].update(v)
 
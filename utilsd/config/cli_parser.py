@@ -1,33 +1,55 @@
-import json
+import functools
 from argparse import ArgumentParser, ArgumentTypeError, SUPPRESS
 from enum import Enum
 from typing import Dict, Type, List
 
+from ..fileio.handlers.json_handler import json_loads
+
+
+_bool_values = {
+    **{v: True for v in ('yes', 'true', 't', 'y', '1')},
+    **{v: False for v in ('no', 'false', 'f', 'n', '0')},
+}
+
 
 def str2bool(v):
     if isinstance(v, bool):
         return v
-    if v.lower() in ('yes', 'true', 't', 'y', '1'):
-        return True
-    elif v.lower() in ('no', 'false', 'f', 'n', '0'):
-        return False
-    else:
+    result = _bool_values.get(v.lower())
+    if result is None:
         raise ArgumentTypeError('Boolean value expected.')
+    return result
 
 
 def str2obj(v):
-    lst = json.loads(v)
+    lst = json_loads(v)
     return lst
 
 
+# bool is a subclass of int, so it has to be looked up before the issubclass fallback
+_argument_types = {
+    int: int,
+    float: float,
+    str: str,
+    bool: str2bool,
+}
+
+
 def infer_type(t):
-    if issubclass(t, (int, float, str)):
-        return t
+    if t in _argument_types:
+        return _argument_types[t]
     if issubclass(t, bool):
         return str2bool
+    if issubclass(t, (int, float, str)):
+        return t
     return str2obj
 
 
+@functools.lru_cache(maxsize=None)
+def _enum_values(enum_type: Type[Enum]) -> tuple:
+    return tuple(e.value for e in enum_type)
+
+
 metavars = {
     int: 'INTEGER',
     str: 'STRING',
@@ -52,23 +74,24 @@ class CliContext:
 
     def build_parser(self, parser: ArgumentParser,
                      shortcuts: Dict[str, List[str]]) -> None:
-        """Modify the parser so that it can handle the names in "visited"."""
-        for name in sorted(self.visited.keys()):
-            type_ = self.visited[name]
+        """Modify the parser so that it can handle the names in "visited".
+        Arguments are added in the order they are visited, i.e., the order of fields in the config."""
+        for name, type_ in self.visited.items():
             shortcut = shortcuts.get(name, [])
 
             if not isinstance(shortcut, list):
                 raise TypeError(f'Shortcut of {name} is not found to be a list: {shortcut}')
 
-            if type_ is type(None):
+            # most arguments are primitives, which are resolved with dict lookups
+            if type_ in metavars:
+                inferred_type = infer_type(type_)
+                parser.add_argument('--' + name, *shortcut, metavar=metavars[type_],
+                                    type=inferred_type, default=SUPPRESS)
+            elif type_ is type(None):
                 # ignore None type when building parser
                 pass
             elif issubclass(type_, Enum):
                 parser.add_argument('--' + name, *shortcut, dest=name, type=str, metavar='STRING',
-                                    default=SUPPRESS, choices=[e.value for e in type_])
-            elif type_ in (int, str, float, bool, list, dict):
-                inferred_type = infer_type(type_)
-                parser.add_argument('--' + name, *shortcut, metavar=metavars[type_],
-                                    type=inferred_type, default=SUPPRESS)
+                                    default=SUPPRESS, choices=_enum_values(type_))
             else:
                 raise TypeError(f'Unsupported type to add argument: {type_}')
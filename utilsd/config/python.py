@@ -3,8 +3,10 @@ Interface of config classes.
 The original PythonConfig is kept for compatibility purposes.
 """
 
+import sys
 import warnings
 from argparse import ArgumentParser, SUPPRESS
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, TypeVar, Tuple, Union, Optional, List
@@ -15,10 +17,9 @@ if True:  # prevent reordering by formatter
     except ImportError:
         from typing_extensions import Protocol
 
-from ..fileio.config import Config
 from .cli_parser import CliContext
 from .exception import ValidationError
-from .type_def import ParseContext, TypeDef
+from .type_def import ParseContext, TypeDef, _lru_put
 
 T = TypeVar('T')
 
@@ -54,7 +55,7 @@ class BaseConfig(Protocol):
         ...
 
     @classmethod
-    def fromcli(cls: T, *,
+    def fromcli(cls: T, argv: Optional[List[str]] = None, *,
                 shortcuts: Optional[Dict[str, str]] = None,
                 allow_rest: bool = False,
                 receive_nni: bool = False) -> Union[T, Tuple[T, List[str]]]:
@@ -63,6 +64,8 @@ class BaseConfig(Protocol):
             python main.py exp.yaml --learning_rate 1e-4
 
         Args:
+            argv (Optional[List[str]], optional): Command line arguments to parse,
+                excluding the program name. Defaults to None, which reads from ``sys.argv``.
             shortcuts (Optional[Dict[str, str]], optional): To create short command line arguments.
                 In the form of ``{'-lr': 'trainer.learning_rate'}``. Defaults to None.
             allow_rest (bool, optional): If false, check if there is any unrecognized
@@ -144,6 +147,7 @@ def _meta(self):
 
 @classmethod
 def _fromfile(cls, filename, **kwargs):
+    from ..fileio.config import Config
     config = Config.fromfile(filename, **kwargs)
     return TypeDef.load(cls, config.asdict())
 
@@ -153,46 +157,102 @@ def _fromdict(cls, data):
     return TypeDef.load(cls, data)
 
 
-@classmethod
-def _fromcli(cls: T, *, shortcuts=None, allow_rest=False, receive_nni=False):
-    if shortcuts is None:
-        shortcuts = {}
-
-    description = """Command line auto-generated with utilsd.config.
+_CLI_DESCRIPTION = """Command line auto-generated with utilsd.config.
 A path to base config file (like JSON/YAML) needs to be specified first.
 Then some extra arguments to override the fields in the base config.
 Please note the type of arguments (always use `-h` for reference):
 `JSON` type means the field accepts a `JSON` for overriding.
     """
 
-    parser = ArgumentParser(description=description, add_help=False)
-    parser.add_argument('exp', help='Experiment YAML file')
-    args, _ = parser.parse_known_args()
-    default_config = Config.fromfile(args.exp)
-
-    # TODO: default config actually can have missing fields
-    cli_context = CliContext()
+# (arguments, shortcuts) -> parser, bounded like the handler caches of TypeDef
+_cli_parser_cache: 'OrderedDict[Any, ArgumentParser]' = OrderedDict()
+# parser that only looks for the base config file
+_exp_parser: Optional[ArgumentParser] = None
 
-    # first-pass
-    TypeDef.load(cls, default_config.asdict(), ParseContext(cli_context))
 
+def _get_cli_parser(cli_context: CliContext, shortcuts: Dict[str, List[str]]) -> ArgumentParser:
+    """Create the parser for arguments collected in ``cli_context``.
+    The parser only depends on the collected arguments and shortcuts,
+    so it's reused when the same config is parsed again.
+    """
+    key = (
+        tuple(cli_context.visited.items()),
+        tuple((name, tuple(s) if isinstance(s, list) else s) for name, s in shortcuts.items())
+    )
+    if key in _cli_parser_cache:
+        _cli_parser_cache.move_to_end(key)
+        return _cli_parser_cache[key]
+    parser = ArgumentParser(description=_CLI_DESCRIPTION, add_help=False)
+    parser.add_argument('exp', help='Experiment YAML file')
     cli_context.build_parser(parser, shortcuts)
     parser.add_argument(
         '-h', '--help', action='help', default=SUPPRESS,
         help='Show this help message and exit')
-    args, rest = parser.parse_known_args()
-    override_params = vars(args)
-    override_params.pop('exp')
-    default_config.merge_from_dict(override_params)
+    _lru_put(_cli_parser_cache, key, parser)
+    return parser
+
+
+def _find_exp(argv: Optional[List[str]]) -> str:
+    """Find the base config file in command line arguments.
+    It's usually the first argument, which can be read without a parser.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and not argv[0].startswith('-'):
+        return argv[0]
+
+    global _exp_parser
+    if _exp_parser is None:
+        _exp_parser = ArgumentParser(add_help=False)
+        _exp_parser.add_argument('exp')
+    args, _ = _exp_parser.parse_known_args(argv)
+    return args.exp
+
+
+@classmethod
+def _fromcli(cls: T, argv=None, *, shortcuts=None, allow_rest=False, receive_nni=False):
+    from ..fileio.config import Config
+
+    if shortcuts is None:
+        shortcuts = {}
+
+    if argv is None:
+        argv = sys.argv[1:]
+    exp = _find_exp(argv)
+    default_config = Config.fromfile(exp)
+
+    if argv == [exp]:
+        # nothing to override from command line, the parser is not needed
+        configs = TypeDef.load(cls, default_config.asdict())
+        rest = []
+        merged = False
+    else:
+        # TODO: default config actually can have missing fields
+        cli_context = CliContext()
+
+        # first-pass
+        configs = TypeDef.load(cls, default_config.asdict(), ParseContext(cli_context))
+
+        parser = _get_cli_parser(cli_context, shortcuts)
+        args, rest = parser.parse_known_args(argv)
+        # only the arguments that are actually given show up in the namespace
+        override_params = {name: getattr(args, name) for name in cli_context.visited if hasattr(args, name)}
+        merged = bool(override_params)
+        if merged:
+            default_config.merge_from_dict(override_params)
 
     if receive_nni:
         # gather params from nni
         import nni
         nni_params = nni.get_next_parameter() or {}
-        default_config.merge_from_dict(nni_params)
-
-    # second-pass
-    configs = TypeDef.load(cls, default_config.asdict())
+        if nni_params:
+            default_config.merge_from_dict(nni_params)
+            merged = True
+
+    # second-pass, only needed when something is overridden.
+    # otherwise the first pass has already loaded the same config.
+    if merged:
+        configs = TypeDef.load(cls, default_config.asdict())
 
     if not allow_rest:
         if rest:
@@ -1,6 +1,7 @@
 import dataclasses
+import functools
 import inspect
-from typing import Optional, Type, Union, Generic, TypeVar, ClassVar
+from typing import Dict, Optional, Type, Union, Generic, TypeVar, ClassVar
 
 
 __all__ = ['ClassConfig', 'RegistryConfig', 'RegistryConfig']
@@ -25,6 +26,10 @@ class Registry(type):
             @Converters.register_module()
             class MyConverter:
                 ...
+
+        To register multiple modules at once::
+
+            Converters.register_many({'conv1': MyConverter, 'conv2': MyOtherConverter})
     """
     # Modified from https://github.com/open-mmlab/mmcv/blob/master/mmcv/utils/registry.py
     # registry is a type here because it needs to be used in RegistryClass.
@@ -34,6 +39,8 @@ class Registry(type):
         cls._name = name
         cls._module_dict = {}
         cls._inherit_dict = {} # track whether a module should expand its superclass init parameters when specified with **kwargs
+        cls._inverse_dict = {}  # module -> names, to make inverse_get fast
+        cls._version = 0  # bumped on every change of modules, so that derived data can be cached
         return cls
 
     @property
@@ -44,6 +51,10 @@ class Registry(type):
     def module_dict(cls):
         return cls._module_dict
 
+    @property
+    def version(cls):
+        return cls._version
+
     def __len__(cls):
         return len(cls._module_dict)
 
@@ -65,7 +76,11 @@ class Registry(type):
         raise KeyError(f'{key} not found in {cls}')
         
     def inverse_get(cls, value):
-        keys = [k for k, v in cls._module_dict.items() if v == value]
+        try:
+            keys = cls._inverse_dict.get(value, [])
+        except TypeError:
+            # unhashable, can't be a module
+            keys = []
         if len(keys) != 1:
             raise ValueError(f'{value} needs to appear exactly once in {cls}')
         return keys[0]
@@ -81,8 +96,12 @@ class Registry(type):
         for name in module_name:
             if not force and name in cls._module_dict:
                 raise KeyError(f'{name} is already registered in {cls.name}')
+            if name in cls._module_dict:
+                cls._remove_inverse(name)
+            cls._inverse_dict.setdefault(module_class, []).append(name)
             cls._module_dict[name] = module_class
             cls._inherit_dict[name] = inherit
+            cls._version += 1
 
     def register_module(cls, name: Optional[str] = None, force: bool = False, module: Type = None, *, inherit=False):
         if not isinstance(force, bool):
@@ -106,17 +125,38 @@ class Registry(type):
 
         return _register
 
+    def register_many(cls, modules: Dict[str, Type], force: bool = False, *, inherit=False):
+        """Register multiple modules at once, in the form of ``{name: module}``.
+        Equivalent to calling :meth:`register_module` on each of them.
+        """
+        if not isinstance(modules, dict):
+            raise TypeError(f'modules must be a dict, but got {type(modules)}')
+        for name, module in modules.items():
+            cls.register_module(name, force=force, module=module, inherit=inherit)
+
+    def _remove_inverse(cls, name):
+        names = cls._inverse_dict[cls._module_dict[name]]
+        names.remove(name)
+        if not names:
+            cls._inverse_dict.pop(cls._module_dict[name])
+
     def unregister_module(cls, name_or_module: Union[str, Type]):
         if isinstance(name_or_module, str):
             if name_or_module not in cls._module_dict:
                 raise KeyError(f'{name_or_module} is not found in {cls.name}')
+            cls._remove_inverse(name_or_module)
             cls._module_dict.pop(name_or_module)
+            cls._version += 1
         else:
-            to_remove = [k for k, v in cls._module_dict.items() if v == name_or_module]
+            try:
+                to_remove = cls._inverse_dict.pop(name_or_module, None)
+            except TypeError:
+                to_remove = None
             if not to_remove:
                 raise KeyError(f'{name_or_module} is not found in {cls.name}')
             for k in to_remove:
                 cls._module_dict.pop(k)
+            cls._version += 1
 
 
 class DataclassType(type):
@@ -146,17 +186,30 @@ class SubclassConfig(Generic[T], metaclass=DataclassType):
     """
 
 
+@functools.lru_cache(maxsize=1024)
+def _init_signature(init_fn) -> inspect.Signature:
+    """``inspect.signature`` of an ``__init__``, which is slow and never changes.
+    Classes without their own ``__init__`` share the entry of the class they inherit it from."""
+    return inspect.signature(init_fn)
+
+
 def dataclass_from_class(cls, *, inherit_signature=False):
     """Create a configurable dataclass for a class
     based on its ``__init__`` signature.
+    The dataclass is created once and reused for the same class.
     """
+    return _dataclass_from_class(cls, inherit_signature)
+
+
+@functools.lru_cache(maxsize=1024)
+def _dataclass_from_class(cls, inherit_signature):
     class_name = cls.__name__ + 'Config'
     fields = [
         ('_type', ClassVar[Type], cls),
     ]
     non_default_fields = []
     default_fields = []
-    init_signature = inspect.signature(cls.__init__)
+    init_signature = _init_signature(cls.__init__)
     # Track presented param names. The same name may appear in different classes when **kwargs is passed.
     existing_names = dict()
     expand_super = False
@@ -187,7 +240,7 @@ def dataclass_from_class(cls, *, inherit_signature=False):
     
     # check the super classes of cls 
     for scls in cls.mro()[1:]:
-        scls_signature = inspect.signature(scls.__init__)
+        scls_signature = _init_signature(scls.__init__)
         for idx, param in enumerate(scls_signature.parameters.values()):
             if idx == 0:
                 # skip self
@@ -215,15 +268,16 @@ def dataclass_from_class(cls, *, inherit_signature=False):
                         non_default_fields.append((param.name, param.annotation))
 
     fields = fields + non_default_fields + default_fields
+    # names of the dataclass fields, i.e., the arguments to build the class
+    field_names = tuple(field[0] for field in non_default_fields + default_fields)
 
     def type_fn(self): return self._type
 
     def build_fn(self, **kwargs):
-        result = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
-        for k in kwargs:
-            # silently overwrite the arguments with given ones.
-            # FIXME: add type check when building?
-            result[k] = kwargs[k]
+        result = {name: getattr(self, name) for name in field_names}
+        # silently overwrite the arguments with given ones.
+        # FIXME: add type check when building?
+        result.update(kwargs)
         try:
             return self._type(**result)
         except:
@@ -5,14 +5,19 @@ with type-checking/conversion based on type annotations.
 
 import copy
 import dataclasses
+import functools
+import importlib
 import inspect
 import os
-from contextlib import contextmanager
+import sys
+import types
+import weakref
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path, PosixPath
 from typing import (
     Any, Dict, Generic, Iterable, List, Optional, Tuple, Type,
-    TypeVar, Union
+    TypeVar, Union, get_type_hints
 )
 
 import typeguard
@@ -38,46 +43,38 @@ class ParseContext:
     2. generate cli parser.
     """
 
+    # a new context is created for every load / dump
+    __slots__ = ('path', 'matches', 'cli_context')
+
     def __init__(self, cli_context: Optional[CliContext] = None):
         self.path: List[Union[int, str]] = []
         self.matches: List[List[str]] = [[]]
         self.cli_context = cli_context
 
-    @contextmanager
-    def onto(self, name):
+    def onto(self, name) -> '_OntoContext':
         """Append message for a new level. e.g.,
         a new key in dict/list, a new level in dataclass.
         """
-        self.path.append(name)
-        self.matches.append([])
-        try:
-            yield
-        finally:
-            self.path.pop()
-            self.matches.pop()
+        return _OntoContext(self, name)
 
-    @contextmanager
-    def match(self, type):
+    def match(self, type) -> '_MatchContext':
         """Append message for a new match. e.g.,
         Going forward in optional, another option in union.
         """
-        self.matches[-1].append(type)
-        try:
-            yield
-        finally:
-            self.matches[-1].pop()
+        return _MatchContext(self, type)
 
     def mark_cli_anchor_point(self, type_: Type) -> None:
         """Mark an anchor point so that the cli context knows.
         This is used to simplify code.
         See the implementation for how to use it.
         """
+        if self.cli_context is None:
+            return
         name = self.current_path
         if not name or any(cha in name for cha in '():'):
             # special names like '(key)xxx' cannot be added to parser
             return
-        if self.cli_context is not None:
-            self.cli_context.add_argument(name, type_)
+        self.cli_context.add_argument(name, type_)
 
     @property
     def message(self) -> Optional[Tuple[str]]:
@@ -108,6 +105,39 @@ class ParseContext:
         return f'ParseContext(path={self.path}, matches={self.matches})'
 
 
+# onto() and match() are entered for every value loaded or dumped,
+# where generator-based context managers are considerably slower.
+
+class _OntoContext:
+    __slots__ = ('ctx', 'name')
+
+    def __init__(self, ctx: ParseContext, name: Union[int, str]):
+        self.ctx = ctx
+        self.name = name
+
+    def __enter__(self):
+        self.ctx.path.append(self.name)
+        self.ctx.matches.append([])
+
+    def __exit__(self, *exc_info):
+        self.ctx.path.pop()
+        self.ctx.matches.pop()
+
+
+class _MatchContext:
+    __slots__ = ('ctx', 'type')
+
+    def __init__(self, ctx: ParseContext, type: str):
+        self.ctx = ctx
+        self.type = type
+
+    def __enter__(self):
+        self.ctx.matches[-1].append(self.type)
+
+    def __exit__(self, *exc_info):
+        self.ctx.matches[-1].pop()
+
+
 class TypeDef(Generic[T]):
     """Base class for type definitions.
 
@@ -120,12 +150,17 @@ class TypeDef(Generic[T]):
 
     For subclass override, it is recommended to override ``from_plain`` and ``to_plain``.
     The default ``validate()`` with typeguard should work for most cases.
+    Built-in types whose ``from_plain`` already guarantees the result type skip it,
+    so that nested values are not checked again at every level.
     All TypeError and ValueError raised from ``from_plain`` and ``to_plain`` and ``validate`` will be caught,
     and raise again with proper metadata in the base class.
 
     The overridden method is only called when ``new()`` returns not null.
     """
 
+    # handlers are created for every annotation, and their attributes are accessed for every value
+    __slots__ = ('type',)
+
     def __init__(self, type_: Type[T]) -> None:
         self.type = type_
 
@@ -144,64 +179,137 @@ class TypeDef(Generic[T]):
     def to_plain(self, obj: T, ctx: ParseContext) -> Any:
         raise NotImplementedError()
 
+    def never_loads(self, plain: Any) -> bool:
+        """Cheap check that tells ``from_plain`` will surely fail on ``plain``, e.g., its python type is wrong.
+        Used by union to skip the members that are impossible to match without trying them.
+        It's always safe to return false.
+        """
+        return False
+
     @staticmethod
-    def dump(type: Type[T], obj: T, ctx: Optional[ParseContext] = None) -> Any:
-        if ctx is None:
-            ctx = ParseContext()
+    def _find_handler(type: Type) -> Tuple['TypeDef', str]:
+        """Find the handler for a type, as well as its name (e.g., optional, any, path).
+
+        Handlers are cached per annotation, because creating one can be expensive
+        (e.g., ``ClassConfig`` creates a dataclass from ``__init__`` signature).
+        """
+        global _handler_cache_registry_version
+        if _handler_cache_registry_version != TypeDefRegistry.version:
+            # type definitions have been registered or unregistered
+            _handler_cache.clear()
+            _handler_cache_by_id.clear()
+            _handler_cache_registry_version = TypeDefRegistry.version
+
+        # fast path: the very same annotation object has been seen before
+        # this saves walking through the arguments of annotation to compute the key
+        entry = _handler_cache_by_id.get(id(type))
+        if entry is not None and entry[0] is type:
+            _handler_cache_by_id.move_to_end(id(type))
+            return entry[1]
+
+        try:
+            key = _annotation_key(type)
+            if key in _handler_cache:
+                _handler_cache.move_to_end(key)
+                _lru_put(_handler_cache_by_id, id(type), (type, _handler_cache[key]))
+                return _handler_cache[key]
+        except TypeError:
+            # unhashable annotation
+            key = None
+
         for subclass in TypeDefRegistry.module_dict.values():
             t = subclass.new(type)
             if t is not None:
                 # found a handler
+                # get its name, e.g., optional, any, path
                 def_name = subclass.__name__.lower()
                 if def_name.endswith('def'):
                     def_name = def_name[:-3]
-                with ctx.match(def_name):
-                    try:
-                        return t.to_plain(obj, ctx)
-                    except (TypeError, ValueError, ImportError) as e:
-                        # add message for location here
-                        err_message = 'Object can not be dumped.'
-                        if ctx.message:
-                            err_message += ' Cause: ' + str(e) + '\n  Parser location: ' + \
-                                ctx.message[0] + '\n  Matched types: ' + \
-                                ctx.message[1] + '\n  Object: ' + str(obj)
-                        raise ValidationError(err_message)
+                if key is not None:
+                    _lru_put(_handler_cache, key, (t, def_name))
+                _lru_put(_handler_cache_by_id, id(type), (type, (t, def_name)))
+                return t, def_name
         raise TypeError(f'No hook found for type: {type}')
 
+    @staticmethod
+    def dump(type: Type[T], obj: T, ctx: Optional[ParseContext] = None) -> Any:
+        if ctx is None:
+            ctx = ParseContext()
+        t, def_name = TypeDef._find_handler(type)
+        with ctx.match(def_name):
+            try:
+                return t.to_plain(obj, ctx)
+            except (TypeError, ValueError, ImportError) as e:
+                # add message for location here
+                err_message = 'Object can not be dumped.'
+                if ctx.message:
+                    err_message += ' Cause: ' + str(e) + '\n  Parser location: ' + \
+                        ctx.message[0] + '\n  Matched types: ' + \
+                        ctx.message[1] + '\n  Object: ' + str(obj)
+                raise ValidationError(err_message)
+
     @staticmethod
     def load(type: Type[T], payload: Any, ctx: Optional[ParseContext] = None) -> T:
         if ctx is None:
             ctx = ParseContext()
-        for subclass in TypeDefRegistry.module_dict.values():
-            t = subclass.new(type)
-            if t is not None:
-                # found a handler
-                # get its name, e.g., optional, any, path
-                def_name = subclass.__name__.lower()
-                if def_name.endswith('def'):
-                    def_name = def_name[:-3]
-                with ctx.match(def_name):
-                    try:
-                        converted = t.from_plain(payload, ctx)
-                        t.validate(converted, ctx)
-                        return converted
-                    except (TypeError, ValueError, ImportError) as e:
-                        err_message = 'Object can not be loaded.'
-                        if ctx.message:
-                            err_message += ' Cause: ' + str(e) + '\n  Parser location: ' + \
-                                ctx.message[0] + '\n  Matched types: ' + \
-                                ctx.message[1] + '\n  Object: ' + str(payload)
-                        raise ValidationError(err_message)
-        raise TypeError(f'No hook found for type: {type}')
+        t, def_name = TypeDef._find_handler(type)
+        with ctx.match(def_name):
+            try:
+                converted = t.from_plain(payload, ctx)
+                t.validate(converted, ctx)
+                return converted
+            except (TypeError, ValueError, ImportError) as e:
+                err_message = 'Object can not be loaded.'
+                if ctx.message:
+                    err_message += ' Cause: ' + str(e) + '\n  Parser location: ' + \
+                        ctx.message[0] + '\n  Matched types: ' + \
+                        ctx.message[1] + '\n  Object: ' + str(payload)
+                raise ValidationError(err_message)
+
+
+# handlers hold their annotations, so the caches are bounded (least recently used are dropped),
+# otherwise annotations of dynamically created types (e.g., local dataclasses) could never be collected
+_HANDLER_CACHE_SIZE = 1024
+# annotation key -> (handler, name of handler)
+_handler_cache: 'OrderedDict[Any, Tuple[TypeDef, str]]' = OrderedDict()
+# id(annotation) -> (annotation, (handler, name of handler))
+# the annotation is kept while the entry lives, so that its id won't be reused
+_handler_cache_by_id: 'OrderedDict[int, Tuple[Any, Tuple[TypeDef, str]]]' = OrderedDict()
+# version of TypeDefRegistry that the caches are built with
+_handler_cache_registry_version = None
+
+
+def _lru_put(cache: 'OrderedDict', key: Any, value: Any) -> None:
+    cache[key] = value
+    if len(cache) > _HANDLER_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _annotation_key(type_: Any) -> Any:
+    """Hashable key of an annotation, used for caching.
+
+    ``Union`` compares equal regardless of the order of its arguments,
+    but the order matters when loading. So the arguments are part of the key.
+    """
+    args = getattr(type_, '__args__', None)
+    if not isinstance(args, tuple):
+        return type_
+    return type_, tuple(_annotation_key(arg) for arg in args)
 
 
 class AnyDef(TypeDef):
+    __slots__ = ()
+
     @classmethod
     def new(cls, type_):
         if type_ is Any:
             return cls(type_)
         return None
 
+    def validate(self, converted, ctx):
+        # anything is allowed
+        pass
+
     def from_plain(self, plain, ctx):
         return plain
 
@@ -210,6 +318,8 @@ class AnyDef(TypeDef):
 
 
 class NoneTypeDef(TypeDef):
+    __slots__ = ()
+
     @classmethod
     def new(cls, type_):
         if type_ is type(None):
@@ -220,6 +330,9 @@ class NoneTypeDef(TypeDef):
         ctx.mark_cli_anchor_point(type(None))
         return plain
 
+    def never_loads(self, plain):
+        return plain is not None
+
     def to_plain(self, obj, ctx):
         if obj is None:
             return None
@@ -227,18 +340,38 @@ class NoneTypeDef(TypeDef):
             raise TypeError(f'Expected None, got {obj}')
 
 
+# X | Y annotations (PEP 604) since python 3.10
+_union_type = getattr(types, 'UnionType', None)
+
+
+def _is_union(type_: Any) -> bool:
+    if getattr(type_, '__origin__', None) == Union:
+        return True
+    return _union_type is not None and isinstance(type_, _union_type)
+
+
 class OptionalDef(TypeDef):
+    __slots__ = ('inner_type',)
+
     @classmethod
     def new(cls, type_):
+        if not _is_union(type_):
+            return None
+        args = type_.__args__
         self = cls(type_)
-        if str(type_).startswith('typing.Optional['):
-            self.inner_type = type_.__args__[0]
-        elif getattr(type_, '__origin__', None) == Union and type_.__args__[1] == type(None):
-            self.inner_type = type_.__args__[0]
+        if args[1] is type(None):
+            self.inner_type = args[0]
+        elif len(args) == 2 and args[0] is type(None):
+            # Optional written as Union[None, T]
+            self.inner_type = args[1]
         else:
             return None
         return self
 
+    def validate(self, converted, ctx):
+        # validated when the inner type is loaded
+        pass
+
     def from_plain(self, plain, ctx):
         if plain is None:
             # if inner type is one of primitives,
@@ -254,8 +387,17 @@ class OptionalDef(TypeDef):
         return TypeDef.dump(self.inner_type, obj, ctx=ctx)
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_path(path: str) -> Path:
+    # paths are immutable, so they can be shared among loaded configs
+    return Path(path)
+
+
 class PathDef(TypeDef):
+    __slots__ = ()
     pathlike = (Path, PosixPath, os.PathLike)
+    # the flavour that Path() instantiates on this platform
+    concrete_path = type(Path())
 
     @classmethod
     def new(cls, type_):
@@ -263,18 +405,62 @@ class PathDef(TypeDef):
             return cls(type_)
         return None
 
+    def validate(self, converted, ctx):
+        # from_plain always creates a path
+        pass
+
     def from_plain(self, plain, ctx):
-        path = Path(plain)
+        # paths are immutable, no need to construct a new one
+        if type(plain) is self.concrete_path:
+            path = plain
+        elif type(plain) is str:
+            path = _cached_path(plain)
+        else:
+            path = Path(plain)
         ctx.mark_cli_anchor_point(str)
         return path
 
+    def never_loads(self, plain):
+        return not isinstance(plain, (str, os.PathLike))
+
     def to_plain(self, obj, ctx):
         if not isinstance(obj, self.pathlike):
             raise TypeError(f'Expect a tuple, found {type(obj)}: {obj}')
         return str(obj)
 
 
+def _fast_load_values(type_: Type, values: Iterable[Any]) -> Optional[List[Any]]:
+    """Load a collection of primitives or paths in one go, without dispatching for each element.
+    Return None if the elements are not all of the expected type.
+    """
+    if type_ in (int, str, bool):
+        if all(type(value) is type_ for value in values):
+            return list(values)
+    elif type_ is float:
+        if all(type(value) in (int, float) for value in values):
+            return [float(value) for value in values]
+    elif type_ in PathDef.pathlike:
+        if all(type(value) is str for value in values):
+            return [_cached_path(value) for value in values]
+    return None
+
+
+def _fast_dump_values(type_: Type, values: Iterable[Any]) -> Optional[List[Any]]:
+    """Counterpart of :func:`_fast_load_values` for dump.
+    Return None if the elements are not all of the expected type.
+    """
+    if type_ in primitive_types:
+        if all(type(value) is type_ for value in values):
+            return list(values)
+    elif type_ in PathDef.pathlike:
+        if all(isinstance(value, PathDef.pathlike) for value in values):
+            return [str(value) for value in values]
+    return None
+
+
 class ListDef(TypeDef):
+    __slots__ = ('inner_type',)
+
     @classmethod
     def new(cls, type_):
         if getattr(type_, '__origin__', None) in (list, List):
@@ -286,19 +472,37 @@ class ListDef(TypeDef):
             raise TypeError('Please use `List[Any]` instead of general sequence type like `list`.')
         return None
 
+    def validate(self, converted, ctx):
+        # elements are validated when they are loaded
+        pass
+
     def from_plain(self, plain, ctx):
         if not isinstance(plain, list):
             raise TypeError(f'Expect a list, found {type(plain)}: {plain}')
+        if ctx.cli_context is None:
+            # fast path is not used when building cli,
+            # because every element needs to be marked as an anchor point
+            result = _fast_load_values(self.inner_type, plain)
+            if result is not None:
+                return result
+        # bind to locals, as they are looked up once per element
+        load, onto, inner_type = TypeDef.load, ctx.onto, self.inner_type
         result = []
         for i, value in enumerate(plain):
-            with ctx.onto(i):
-                result.append(TypeDef.load(self.inner_type, value, ctx=ctx))
+            with onto(i):
+                result.append(load(inner_type, value, ctx=ctx))
         ctx.mark_cli_anchor_point(list)
         return result
 
+    def never_loads(self, plain):
+        return not isinstance(plain, list)
+
     def to_plain(self, obj, ctx):
         if not isinstance(obj, list):
             raise TypeError(f'Expect a list, found {type(obj)}: {obj}')
+        result = _fast_dump_values(self.inner_type, obj)
+        if result is not None:
+            return result
         result = []
         for i, value in enumerate(obj):
             with ctx.onto(i):
@@ -307,6 +511,8 @@ class ListDef(TypeDef):
 
 
 class TupleDef(TypeDef):
+    __slots__ = ('inner_types',)
+
     @classmethod
     def new(cls, type_):
         if getattr(type_, '__origin__', None) in (tuple, Tuple):
@@ -328,6 +534,9 @@ class TupleDef(TypeDef):
         ctx.mark_cli_anchor_point(list)
         return tuple(result)
 
+    def never_loads(self, plain):
+        return not isinstance(plain, (list, tuple))
+
     def to_plain(self, obj, ctx):
         if not isinstance(obj, tuple):
             raise TypeError(f'Expect a tuple, found {type(obj)}: {obj}')
@@ -339,6 +548,8 @@ class TupleDef(TypeDef):
 
 
 class DictDef(TypeDef):
+    __slots__ = ('key_type', 'value_type')
+
     @classmethod
     def new(cls, type_):
         if getattr(type_, '__origin__', None) in (dict, Dict):
@@ -351,26 +562,49 @@ class DictDef(TypeDef):
             raise TypeError('Please use `Dict[xxx, xxx]` instead of dict.')
         return None
 
+    def validate(self, converted, ctx):
+        # keys and values are validated when they are loaded
+        pass
+
     def from_plain(self, plain, ctx):
         if not isinstance(plain, dict):
             raise TypeError(f'Expect a dict, found {type(plain)}: {plain}')
+        # keys of str type are very common, and loading them is a no-op
+        str_keys = self.key_type is str and all(type(key) is str for key in plain)
+        if str_keys and ctx.cli_context is None:
+            # same as list, fast path is not used when building cli
+            values = _fast_load_values(self.value_type, plain.values())
+            if values is not None:
+                return dict(zip(plain, values))
+        # bind to locals, as they are looked up once per item
+        load, onto, key_type, value_type = TypeDef.load, ctx.onto, self.key_type, self.value_type
         result = {}
         for key, value in plain.items():
-            with ctx.onto(f'(key){key}'):
-                key = TypeDef.load(self.key_type, key, ctx=ctx)
-            with ctx.onto(str(key)):
-                value = TypeDef.load(self.value_type, value, ctx=ctx)
+            if not str_keys:
+                with onto(f'(key){key}'):
+                    key = load(key_type, key, ctx=ctx)
+            with onto(str(key)):
+                value = load(value_type, value, ctx=ctx)
             result[key] = value
         ctx.mark_cli_anchor_point(dict)
         return result
 
+    def never_loads(self, plain):
+        return not isinstance(plain, dict)
+
     def to_plain(self, obj, ctx):
         if not isinstance(obj, dict):
             raise TypeError(f'Expect a dict, found {type(obj)}: {obj}')
+        str_keys = self.key_type is str and all(type(key) is str for key in obj)
+        if str_keys:
+            values = _fast_dump_values(self.value_type, obj.values())
+            if values is not None:
+                return dict(zip(obj, values))
         result = {}
         for key, value in obj.items():
-            with ctx.onto(f'(key){key}'):
-                key = TypeDef.dump(self.key_type, key, ctx=ctx)
+            if not str_keys:
+                with ctx.onto(f'(key){key}'):
+                    key = TypeDef.dump(self.key_type, key, ctx=ctx)
             with ctx.onto(str(key)):
                 value = TypeDef.dump(self.value_type, value, ctx=ctx)
             result[key] = value
@@ -378,14 +612,29 @@ class DictDef(TypeDef):
 
 
 class EnumDef(TypeDef):
+    __slots__ = ()
+
     @classmethod
     def new(cls, type_):
         if inspect.isclass(type_) and issubclass(type_, Enum):
             return cls(type_)
         return None
 
+    def validate(self, converted, ctx):
+        # from_plain always returns a member of the enum
+        pass
+
     def from_plain(self, plain, ctx):
-        result = self.type(plain)
+        if type(plain) is self.type:
+            # already a member, e.g., the default value of a field
+            result = plain
+        else:
+            try:
+                # skip the dispatch in EnumMeta.__call__ for the common case
+                result = self.type._value2member_map_[plain]
+            except (KeyError, TypeError):
+                # _missing_, unhashable values and error message are handled by enum itself
+                result = self.type(plain)
         ctx.mark_cli_anchor_point(self.type)
         return result
 
@@ -396,55 +645,106 @@ class EnumDef(TypeDef):
 
 
 class UnionDef(TypeDef):
+    __slots__ = ('inner_types', 'members')
+
     @classmethod
     def new(cls, type_):
-        if getattr(type_, '__origin__', None) == Union:
+        if _is_union(type_):
             self = cls(type_)
             self.inner_types = list(type_.__args__)
+            self.members = None
             return self
         return None
 
+    def _resolve_members(self) -> List[Tuple[Type, str, Optional[TypeDef]]]:
+        """Resolve (type, match message, handler) of each type in union.
+        Done lazily, because a handler might be missing for some of the types.
+        """
+        if self.members is None:
+            members = []
+            for type_ in self.inner_types:
+                try:
+                    t, _ = TypeDef._find_handler(type_)
+                except TypeError:
+                    t = None
+                # str() of an annotation is only needed when it has no name
+                name = type_.__name__ if hasattr(type_, '__name__') else str(type_)
+                members.append((type_, 'union:' + name, t))
+            self.members = members
+        return self.members
+
+    @staticmethod
+    def _never_loads(handler, plain):
+        """Tell whether loading ``plain`` with ``handler`` is known to fail beforehand,
+        without going through the exception of the failed attempt.
+        """
+        if handler is None:
+            # no hook found, loading will fail anyway
+            return True
+        return handler.never_loads(plain)
+
+    def validate(self, converted, ctx):
+        # validated when the matched type is loaded
+        pass
+
     def from_plain(self, plain, ctx):
         # try types in union one by one, skip when validation error
         # until exhausted
-        def _try_types(types):
-            if not types:
+        members = self._resolve_members()
+
+        def _try_types(index):
+            if index == len(members):
                 raise TypeError(f'All possible types from union {self.inner_types} are exhausted.')
-            with ctx.match('union:' + getattr(types[0], '__name__', str(types[0]))):
+            type_, match_message, handler = members[index]
+            if self._never_loads(handler, plain):
+                return _try_types(index + 1)
+            with ctx.match(match_message):
                 try:
-                    return TypeDef.load(types[0], plain, ctx=ctx)
+                    return TypeDef.load(type_, plain, ctx=ctx)
                     # catch both validation error and unsupported type error
                 except (TypeError, ValidationError):
-                    return _try_types(types[1:])
+                    return _try_types(index + 1)
 
-        return _try_types(self.inner_types)
+        return _try_types(0)
 
     def to_plain(self, obj, ctx):
-        def _try_types(types):
-            if not types:
+        members = self._resolve_members()
+
+        def _try_types(index):
+            if index == len(members):
                 raise TypeError(f'All possible types from union {self.inner_types} are exhausted.')
-            with ctx.match('union:' + getattr(types[0], '__name__', str(types[0]))):
+            type_, match_message, _ = members[index]
+            with ctx.match(match_message):
                 try:
-                    return TypeDef.dump(types[0], obj, ctx=ctx)
+                    return TypeDef.dump(type_, obj, ctx=ctx)
                 except (TypeError, ValidationError):
-                    return _try_types(types[1:])
+                    return _try_types(index + 1)
 
-        return _try_types(self.inner_types)
+        return _try_types(0)
 
 
 class PrimitiveDef(TypeDef):
+    __slots__ = ()
+
     @classmethod
     def new(cls, type_):
         if inspect.isclass(type_) and issubclass(type_, primitive_types):
             return cls(type_)
         return None
 
+    def validate(self, converted, ctx):
+        # from_plain always creates an instance of the type
+        pass
+
     def from_plain(self, plain, ctx):
         # support implicit conversion here
         if not isinstance(plain, primitive_types):
             raise ValueError(f'Cannot implicitly cast a variable with type {type(plain)}'
                              f' to {primitive_types}: {plain}')
-        if issubclass(self.type, float):
+        if type(plain) is self.type:
+            # no conversion needed
+            result = plain
+        elif issubclass(self.type, float):
             result = float(plain)
         elif issubclass(self.type, (int, bool)):
             # check converting to int is not numerically equal
@@ -457,13 +757,90 @@ class PrimitiveDef(TypeDef):
         ctx.mark_cli_anchor_point(self.type)
         return result
 
+    def never_loads(self, plain):
+        if not isinstance(plain, primitive_types):
+            return True
+        # float that is not numerically equal to an int can't be cast to int / bool
+        return issubclass(self.type, int) and isinstance(plain, float) and not plain.is_integer()
+
     def to_plain(self, obj, ctx):
         if not isinstance(obj, self.type):
             raise TypeError(f'Expected {self.type}, found {obj} of type: {type(obj)}')
         return obj
 
 
+# dataclass -> fields of dataclass
+# weak references so that dynamically created dataclasses (e.g., ClassConfig) can be collected
+_fields_cache: 'weakref.WeakKeyDictionary[Type, Tuple[dataclasses.Field, ...]]' = weakref.WeakKeyDictionary()
+
+
+def _dataclass_fields(type_: Type) -> Tuple[dataclasses.Field, ...]:
+    """Same as ``dataclasses.fields(type_)``, but computed only once per dataclass.
+    String annotations (e.g., with ``from __future__ import annotations``) are resolved here,
+    so that they are evaluated once rather than every time the dataclass is loaded."""
+    try:
+        return _fields_cache[type_]
+    except KeyError:
+        fields = dataclasses.fields(type_)
+        if any(isinstance(field.type, str) for field in fields):
+            fields = _resolve_field_types(type_, fields)
+        _fields_cache[type_] = fields
+        return fields
+
+
+def _resolve_field_types(type_: Type, fields: Tuple[dataclasses.Field, ...]) -> Tuple[dataclasses.Field, ...]:
+    try:
+        hints = get_type_hints(type_)
+    except Exception:
+        # unresolvable annotations are left as they are
+        return fields
+    resolved = []
+    for field in fields:
+        if isinstance(field.type, str) and field.name in hints:
+            # copy, so that the fields of the dataclass itself are not touched
+            field = copy.copy(field)
+            field.type = hints[field.name]
+        resolved.append(field)
+    return tuple(resolved)
+
+
+_MISSING = dataclasses.MISSING
+
+_plain_init_cache: 'weakref.WeakKeyDictionary[Type, bool]' = weakref.WeakKeyDictionary()
+
+
+def _has_plain_init(type_: Type) -> bool:
+    """Whether ``type_(**kwargs)`` only assigns the fields, i.e., the ``__init__`` is generated by dataclass
+    for ``type_`` itself, every field is an init field, and there is no ``__new__``, ``__post_init__`` or ``__slots__``.
+    Such dataclasses can be created by filling ``__dict__`` directly."""
+    try:
+        return _plain_init_cache[type_]
+    except KeyError:
+        params = getattr(type_, '__dataclass_params__', None)
+        init_code = getattr(type_.__dict__.get('__init__'), '__code__', None)
+        result = _plain_init_cache[type_] = (
+            params is not None and params.init and init_code is not None and
+            # dataclass keeps an ``__init__`` written in the class body
+            init_code.co_filename == '<string>' and
+            type_.__new__ is object.__new__ and
+            not hasattr(type_, '__post_init__') and not hasattr(type_, '__slots__') and
+            all(field.init for field in _dataclass_fields(type_))
+        )
+        return result
+
+
+def _construct_validated(type_: Type, kwargs: Dict[str, Any]) -> Any:
+    """Create a dataclass instance from field values that are already loaded."""
+    if _has_plain_init(type_):
+        inst = object.__new__(type_)
+        inst.__dict__.update(kwargs)
+        return inst
+    return type_(**kwargs)
+
+
 class DataclassDef(TypeDef):
+    __slots__ = ()
+
     @classmethod
     def new(cls, type_):
         if dataclasses.is_dataclass(type_):
@@ -474,14 +851,10 @@ class DataclassDef(TypeDef):
     @staticmethod
     def _is_missing(obj: Any) -> bool:
         # no default value
-        return isinstance(obj, type(dataclasses.MISSING))
+        return obj is _MISSING
 
     def validate(self, converted, ctx):
-        for field in dataclasses.fields(converted):
-            value = getattr(converted, field.name)
-            typeguard.check_type(f'{value} ({ctx.current_name} -> {field.name})',
-                                 value, field.type)
-
+        # fields are already validated when they are loaded
         # if dataclass has a post validation
         if hasattr(converted, 'post_validate'):
             try:
@@ -509,7 +882,7 @@ class DataclassDef(TypeDef):
             if not isinstance(plain, type_):
                 raise TypeError(f'Expect a dataclass of type {type_}, but found {type(plain)}: {plain}')
 
-            for field in dataclasses.fields(type_):
+            for field in _dataclass_fields(type_):
                 with ctx.onto(field.name):
                     # retrieve & transform & update
                     value = getattr(plain, field.name)
@@ -519,38 +892,52 @@ class DataclassDef(TypeDef):
             inst = plain
 
         else:
-            # copy the raw object to prevent unexpected modification
-            plain = copy.copy(plain)
-
             # the content with name `_meta` is ignored
             # it is reserved for writing comments
-            _meta = plain.pop('_meta', None)
+            # the raw object is only read, so that it's not unexpectedly modified
+            _meta = plain.get('_meta', None)
+            num_consumed = int('_meta' in plain)
+            # no argument needs to be marked for command line
+            no_cli = ctx.cli_context is None
+            # bound once, they are used for every field
+            load, onto = TypeDef.load, ctx.onto
             kwargs = {}
-            for field in dataclasses.fields(type_):
+            for field in _dataclass_fields(type_):
+                name, field_type = field.name, field.type
                 # get the values with content, otherwise default
-                value = plain.pop(field.name, field.default)
+                if name in plain:
+                    value = plain[name]
+                    num_consumed += 1
+                else:
+                    value = field.default
+                if no_cli and type(value) is field_type and field_type in primitive_types:
+                    # what PrimitiveDef.from_plain would return, without dispatching
+                    kwargs[name] = value
+                    continue
                 # if no default value exists
-                if self._is_missing(value):
+                if value is _MISSING:
                     # throw error early
                     raise ValueError(f'`{field}` is expected, but it is not set')
                 # Load should be done for both situations:
                 # 1. value is set
                 # 2. no value set, default value is used
                 # Case 2 is to handle situations where users use plain format to write a default value
-                with ctx.onto(field.name):
-                    value = TypeDef.load(field.type, value, ctx=ctx)
-                kwargs[field.name] = value
-            if plain:
-                fields = ', '.join(plain.keys())
+                with onto(name):
+                    kwargs[name] = load(field_type, value, ctx=ctx)
+            if num_consumed < len(plain):
+                fields = ', '.join(k for k in plain if k != '_meta' and k not in kwargs)
                 raise ValueError(f'{type_.__name__}: Unrecognized fields {fields}')
 
             # creating dataclass
-            inst = type_(**kwargs)
+            inst = _construct_validated(type_, kwargs)
             inst._meta = _meta
 
         ctx.mark_cli_anchor_point(dict)
         return inst
 
+    def never_loads(self, plain):
+        return not isinstance(plain, dict) and not dataclasses.is_dataclass(plain)
+
     def to_plain(self, obj, ctx, type_=None, result=None):
         if type_ is None:
             type_ = self.type
@@ -560,14 +947,20 @@ class DataclassDef(TypeDef):
                 raise TypeError(f'Expected {type_}, found {obj} of type: {type(obj)}')
         if not result:
             result = {}
-        for field in dataclasses.fields(obj):
+        for field in _dataclass_fields(type(obj)):
+            value = getattr(obj, field.name)
+            if type(value) is field.type and field.type in primitive_types:
+                # what PrimitiveDef.to_plain would return, without dispatching
+                result[field.name] = value
+                continue
             with ctx.onto(field.name):
-                value = getattr(obj, field.name)
                 result[field.name] = TypeDef.dump(field.type, value, ctx=ctx)
         return result
 
 
 class ClassConfigDef(DataclassDef):
+    __slots__ = ('inner_type',)
+
     @classmethod
     def new(cls, type_):
         if getattr(type_, '__origin__', None) == ClassConfig:
@@ -587,6 +980,8 @@ class ClassConfigDef(DataclassDef):
 
 
 class RegistryConfigDef(DataclassDef):
+    __slots__ = ('registry',)
+
     @classmethod
     def new(cls, type_):
         if getattr(type_, '__origin__', None) == RegistryConfig:
@@ -603,9 +998,13 @@ class RegistryConfigDef(DataclassDef):
         # copy the raw object to prevent unexpected modification
         plain = copy.copy(plain)
         type_, inherit = self.registry.get_module_with_inherit(plain.pop('type'))
+        # the dataclass is cached by dataclass_from_class
         dataclass = dataclass_from_class(type_, inherit_signature=inherit)
         return super().from_plain(plain, ctx, type_=dataclass)
 
+    def never_loads(self, plain):
+        return not isinstance(plain, dict)
+
     def to_plain(self, obj, ctx):
         if not dataclasses.is_dataclass(obj) or not hasattr(obj, 'type'):
             raise TypeError(f'Expect a dataclass with type(), found {obj} of type {type(obj)}')
@@ -614,7 +1013,23 @@ class RegistryConfigDef(DataclassDef):
         return super().to_plain(obj, ctx, type_=obj.type(), result={'type': type_name})
 
 
+def _is_replaced(class_type: Type) -> bool:
+    """Whether the class is replaced by another class defined with the same name in its module,
+    e.g., the module is reloaded, or the cell defining it is run again in a notebook.
+    Classes that are not reachable from their modules (e.g., local classes) are never considered replaced.
+    """
+    module = sys.modules.get(class_type.__module__)
+    if module is None or '<locals>' in class_type.__qualname__:
+        return False
+    current = module
+    for name in class_type.__qualname__.split('.'):
+        current = getattr(current, name, None)
+    return isinstance(current, type) and current is not class_type
+
+
 class SubclassConfigDef(DataclassDef):
+    __slots__ = ('base_class', 'classes', 'import_paths')
+
     @classmethod
     def new(cls, type_):
         if getattr(type_, '__origin__', None) == SubclassConfig:
@@ -622,9 +1037,26 @@ class SubclassConfigDef(DataclassDef):
             self = cls(type_)
             # inner type is not available here
             self.base_class = self.type.__args__[0]
+            # class name -> weak reference to class, found with _find_class
+            self.classes = {}
+            # class -> name written as type when dumped
+            # weak keys, so that classes are not kept alive only for being dumped once
+            self.import_paths = weakref.WeakKeyDictionary()
             return self
         return None
 
+    def _find_class_cached(self, cls_name: str) -> Type:
+        """Same as ``_find_class``, but the search is only done once for every name.
+        Classes that are not found are searched again next time, as they might be defined later.
+        So are classes that have been collected, or replaced by a redefinition (e.g., module reload).
+        """
+        ref = self.classes.get(cls_name)
+        subclass = ref() if ref is not None else None
+        if subclass is None or _is_replaced(subclass):
+            subclass = self._find_class(cls_name, self.base_class)
+            self.classes[cls_name] = weakref.ref(subclass)
+        return subclass
+
     @staticmethod
     def _find_class(cls_name: str, base_class: Type) -> Type:
         """Find class with exact class name or attribute named ``alias``.
@@ -635,13 +1067,19 @@ class SubclassConfigDef(DataclassDef):
                 yield from _iterate_subclass(subclass)
 
         for subclass in _iterate_subclass(base_class):
+            if _is_replaced(subclass):
+                # a stale definition that still lives
+                continue
             if subclass.__name__ == cls_name:
                 return subclass
             if hasattr(subclass, 'alias') and subclass.alias == cls_name:
                 return subclass
         if '.' in cls_name:
             path, identifier = cls_name.rsplit('.', 1)
-            module = __import__(path, globals(), locals(), [identifier])
+            # skip the import machinery for modules that have been imported
+            module = sys.modules.get(path)
+            if module is None:
+                module = importlib.import_module(path)
             if hasattr(module, identifier):
                 subclass = getattr(module, identifier)
                 assert issubclass(subclass, base_class), f'{subclass} is not a subclass of {base_class}.'
@@ -654,9 +1092,13 @@ class SubclassConfigDef(DataclassDef):
         # copy the raw object to prevent unexpected modification
         plain = copy.copy(plain)
 
-        type_ = self._find_class(plain.pop('type'), self.base_class)
-        dataclass = dataclass_from_class(type_)
-        return super().from_plain(plain, ctx, type_=dataclass)
+        type_ = self._find_class_cached(plain.pop('type'))
+        # dataclass_from_class caches the dataclass per class, with a bounded cache,
+        # so that dataclasses of replaced classes are not held here
+        return super().from_plain(plain, ctx, type_=dataclass_from_class(type_))
+
+    def never_loads(self, plain):
+        return not isinstance(plain, dict)
 
     def to_plain(self, obj, ctx):
         if not dataclasses.is_dataclass(obj) or not hasattr(obj, 'type'):
@@ -664,16 +1106,21 @@ class SubclassConfigDef(DataclassDef):
 
         # obj is a dataclass, type() is its original class
         class_type = obj.type()
+        import_path = self.import_paths.get(class_type)
+        if import_path is None or _is_replaced(class_type):
+            # a replaced class can no longer be found with its old path, check it again
+            import_path = self.import_paths[class_type] = self._import_path(class_type)
+
+        return super().to_plain(obj, ctx, type_=class_type, result={'type': import_path})
 
+    def _import_path(self, class_type: Type) -> str:
         # do the inverse of find class
         if hasattr(class_type, 'alias'):
-            import_path = class_type.alias
-        else:
-            import_path = class_type.__module__ + '.' + class_type.__name__
-            if self._find_class(import_path, self.base_class) != class_type:
-                raise ImportError(f'{class_type} cannot be created via importing from {import_path}')
-
-        return super().to_plain(obj, ctx, type_=class_type, result={'type': import_path})
+            return class_type.alias
+        import_path = class_type.__module__ + '.' + class_type.__name__
+        if self._find_class_cached(import_path) != class_type:
+            raise ImportError(f'{class_type} cannot be created via importing from {import_path}')
+        return import_path
 
 
 # register all the modules in this file
@@ -94,14 +94,31 @@ def setup_experiment(runtime_config: RuntimeConfig, enable_nni: bool = False,
     return runtime_config
 
 
+class _ConfigEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Enum):
+            return obj.value
+        if isinstance(obj, Path):
+            return obj.as_posix()
+        return super().default(obj)
+
+
+def _config_asdict(obj):
+    """Same as ``dataclasses.asdict``, except that leaf values are not deep-copied.
+    The result is only printed and dumped, so sharing the leaves is safe."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _config_asdict(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+    elif isinstance(obj, tuple) and hasattr(obj, '_fields'):
+        # namedtuple
+        return type(obj)(*[_config_asdict(v) for v in obj])
+    elif isinstance(obj, (list, tuple)):
+        return type(obj)(_config_asdict(v) for v in obj)
+    elif isinstance(obj, dict):
+        return type(obj)((_config_asdict(k), _config_asdict(v)) for k, v in obj.items())
+    return obj
+
+
 def print_config(config, dump_config=True, output_dir=None, expand_config=True):
-    class Encoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, Enum):
-                return obj.value
-            if isinstance(obj, Path):
-                return obj.as_posix()
-            return super().default(obj)
 
     if isinstance(config, dict):
         config_meta = None
@@ -109,19 +126,19 @@ def print_config(config, dump_config=True, output_dir=None, expand_config=True):
         if output_dir is None:
             output_dir = get_output_dir()
         config_meta = config.meta()
-        config = dataclasses.asdict(config)
+        config = _config_asdict(config)
 
-    print_log('Config: ' + json.dumps(config, cls=Encoder), __name__)
+    print_log('Config: ' + json.dumps(config, cls=_ConfigEncoder), __name__)
     if config_meta is not None:
-        print_log('Config (meta): ' + json.dumps(config_meta, cls=Encoder), __name__)
+        print_log('Config (meta): ' + json.dumps(config_meta, cls=_ConfigEncoder), __name__)
     if expand_config:
         print_log('Config (expanded):\n' + pprint.pformat(config), __name__)
     if dump_config:
         with open(os.path.join(output_dir, 'config.json'), 'w') as fh:
-            json.dump(config, fh, cls=Encoder)
+            json.dump(config, fh, cls=_ConfigEncoder)
         if config_meta is not None:
             with open(os.path.join(output_dir, 'config_meta.json'), 'w') as fh:
-                json.dump(config_meta, fh, cls=Encoder)
+                json.dump(config_meta, fh, cls=_ConfigEncoder)
 
 
 def get_runtime_config():
@@ -1,6 +1,9 @@
 # This file is modified from https://github.com/open-mmlab/mmcv/blob/master/mmcv/utils/config.py
 # Copyright (c) Open-MMLab. All rights reserved.
 import ast
+import io
+import json
+import os
 import os.path as osp
 import platform
 import re
@@ -9,12 +12,11 @@ import sys
 import tempfile
 import warnings
 from argparse import Action, ArgumentParser
-from collections import abc
+from collections import OrderedDict, abc
 from importlib import import_module
 from pathlib import Path
 
 from addict import Dict
-from yapf.yapflib.yapf_api import FormatCode
 
 from .io import load as mmcv_load, dump as mmcv_dump
 
@@ -23,6 +25,15 @@ DELETE_KEY = '_delete_'
 CUSTOM_IMPORT_KEY = '_custom_imports_'
 RESERVED_KEYS = ['filename', 'text', 'pretty_text']
 
+# the least recently used files are dropped, so that temporary config files are not kept forever
+_PARSED_FILE_CACHE_SIZE = 1024
+# (filename, use_predefined_variables) -> ((mtime, size), cfg_dict, cfg_text)
+_parsed_file_cache = OrderedDict()
+
+# set to 1 to store parsed YAML files in a JSON file next to them, which is much faster to load
+YAML_CACHE_ENV = 'UTILSD_YAML_CACHE'
+YAML_CACHE_SUFFIX = '.cache.json'
+
 
 def check_file_exist(filename, msg_tmpl='file "{}" does not exist'):
     if not osp.isfile(filename):
@@ -143,6 +154,17 @@ class Config:
 
     @staticmethod
     def _substitute_predefined_vars(filename, temp_config_name):
+        with open(filename, 'r') as f:
+            config_file = f.read()
+        config_file = Config._substitute_predefined_vars_in_text(filename, config_file)
+        with open(temp_config_name, 'w') as tmp_config_file:
+            tmp_config_file.write(config_file)
+
+    @staticmethod
+    def _substitute_predefined_vars_in_text(filename, config_file):
+        if '{{' not in config_file:
+            # no template in the file
+            return config_file
         file_dirname = osp.dirname(filename)
         file_basename = osp.basename(filename)
         file_basename_no_extension = osp.splitext(file_basename)[0]
@@ -152,22 +174,101 @@ class Config:
             fileBasename=file_basename,
             fileBasenameNoExtension=file_basename_no_extension,
             fileExtname=file_extname)
-        with open(filename, 'r') as f:
-            config_file = f.read()
         for key, value in support_templates.items():
             regexp = r'\{\{\s*' + str(key) + r'\s*\}\}'
             value = value.replace('\\', '/')
             config_file = re.sub(regexp, value, config_file)
-        with open(temp_config_name, 'w') as tmp_config_file:
-            tmp_config_file.write(config_file)
+        return config_file
 
     @staticmethod
-    def _file2dict(filename, use_predefined_variables=True):
-        filename = osp.abspath(osp.expanduser(filename))
-        check_file_exist(filename)
+    def _parse_file(filename, use_predefined_variables=True):
+        """Parse a single config file, without handling its base configs."""
+        use_sidecar = filename.endswith(('.yml', '.yaml')) and os.environ.get(YAML_CACHE_ENV) == '1'
+        cfg_dict = None
+        if use_sidecar:
+            cfg_dict = Config._read_yaml_sidecar(filename, use_predefined_variables)
+        if cfg_dict is None:
+            cfg_dict = Config._parse_file_content(filename, use_predefined_variables)
+            if use_sidecar:
+                Config._write_yaml_sidecar(filename, use_predefined_variables, cfg_dict)
+
+        cfg_text = filename + '\n'
+        with open(filename, 'r') as f:
+            cfg_text += f.read()
+
+        return cfg_dict, cfg_text
+
+    @staticmethod
+    def _yaml_sidecar_stamp(filename, use_predefined_variables):
+        stat = os.stat(filename)
+        stamp = [stat.st_mtime_ns, stat.st_size, use_predefined_variables]
+        if use_predefined_variables:
+            # substituted variables (e.g., fileDirname) depend on where the file is,
+            # a copy that keeps mtime (e.g., cp -p) must not reuse them
+            stamp.append(osp.abspath(filename))
+        return stamp
+
+    @staticmethod
+    def _read_yaml_sidecar(filename, use_predefined_variables):
+        """Read the parsed content of a YAML file from its JSON sidecar.
+        Return None if the sidecar doesn't exist or is outdated.
+        """
+        try:
+            with open(filename + YAML_CACHE_SUFFIX, 'r') as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(sidecar, dict) or \
+                sidecar.get('stamp') != Config._yaml_sidecar_stamp(filename, use_predefined_variables):
+            return None
+        return sidecar.get('config')
+
+    @staticmethod
+    def _write_yaml_sidecar(filename, use_predefined_variables, cfg_dict):
+        """Write the parsed content of a YAML file to its JSON sidecar.
+        Skipped if the content can't survive a JSON round trip (e.g., non-string keys, dates),
+        or the directory is not writable.
+        """
+        try:
+            content = json.dumps({
+                'stamp': Config._yaml_sidecar_stamp(filename, use_predefined_variables),
+                'config': cfg_dict
+            })
+        except (TypeError, ValueError):
+            return
+        if json.loads(content)['config'] != cfg_dict:
+            return
+        sidecar_name = filename + YAML_CACHE_SUFFIX
+        try:
+            fd, temp_name = tempfile.mkstemp(dir=osp.dirname(osp.abspath(filename)), suffix=YAML_CACHE_SUFFIX)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+            # atomic, in case of concurrent readers
+            os.replace(temp_name, sidecar_name)
+        except BaseException as e:
+            # never leave the temporary file next to the config
+            try:
+                os.remove(temp_name)
+            except OSError:
+                pass
+            # the sidecar is optional, failing to write it is not an error
+            if not isinstance(e, OSError):
+                raise
+
+    @staticmethod
+    def _parse_file_content(filename, use_predefined_variables=True):
+        """Parse a single config file into a dict."""
         fileExtname = osp.splitext(filename)[1]
-        if fileExtname not in ['.py', '.json', '.yaml', '.yml']:
-            raise IOError('Only py/yml/yaml/json type are supported now!')
+        if fileExtname in ('.yml', '.yaml', '.json'):
+            # data files are parsed in memory, only python files need to be imported from a temporary file
+            with open(filename, 'r') as f:
+                config_file = f.read()
+            if use_predefined_variables:
+                config_file = Config._substitute_predefined_vars_in_text(filename, config_file)
+            return mmcv_load(io.StringIO(config_file), file_format=fileExtname[1:])
 
         with tempfile.TemporaryDirectory() as temp_config_dir:
             temp_config_file = tempfile.NamedTemporaryFile(
@@ -182,27 +283,56 @@ class Config:
             else:
                 shutil.copyfile(filename, temp_config_file.name)
 
-            if filename.endswith('.py'):
-                temp_module_name = osp.splitext(temp_config_name)[0]
-                sys.path.insert(0, temp_config_dir)
-                Config._validate_py_syntax(filename)
-                mod = import_module(temp_module_name)
-                sys.path.pop(0)
-                cfg_dict = {
-                    name: value
-                    for name, value in mod.__dict__.items()
-                    if not name.startswith('__')
-                }
-                # delete imported module
-                del sys.modules[temp_module_name]
-            elif filename.endswith(('.yml', '.yaml', '.json')):
-                cfg_dict = mmcv_load(temp_config_file.name)
+            temp_module_name = osp.splitext(temp_config_name)[0]
+            sys.path.insert(0, temp_config_dir)
+            Config._validate_py_syntax(filename)
+            mod = import_module(temp_module_name)
+            sys.path.pop(0)
+            cfg_dict = {
+                name: value
+                for name, value in mod.__dict__.items()
+                if not name.startswith('__')
+            }
+            # delete imported module
+            del sys.modules[temp_module_name]
             # close temp file
             temp_config_file.close()
 
-        cfg_text = filename + '\n'
-        with open(filename, 'r') as f:
-            cfg_text += f.read()
+        return cfg_dict
+
+    @staticmethod
+    def _parse_file_cached(filename, use_predefined_variables=True):
+        """Same as :meth:`_parse_file`, but YAML/JSON files are only parsed again when modified.
+
+        Python config files are always executed again, as they might have side effects.
+        """
+        if filename.endswith('.py'):
+            return Config._parse_file(filename, use_predefined_variables)
+        stat = os.stat(filename)
+        cache_key = (filename, use_predefined_variables)
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+        if cache_key in _parsed_file_cache and _parsed_file_cache[cache_key][0] == file_stamp:
+            _parsed_file_cache.move_to_end(cache_key)
+            _, cfg_dict, cfg_text = _parsed_file_cache[cache_key]
+        else:
+            cfg_dict, cfg_text = Config._parse_file(filename, use_predefined_variables)
+            _parsed_file_cache[cache_key] = file_stamp, cfg_dict, cfg_text
+            _parsed_file_cache.move_to_end(cache_key)
+            if len(_parsed_file_cache) > _PARSED_FILE_CACHE_SIZE:
+                _parsed_file_cache.popitem(last=False)
+        # callers only modify the top level (e.g., popping ``_base_``), merging is non-inplace,
+        # and nested values are copied when wrapped with ``ConfigDict``
+        return dict(cfg_dict), cfg_text
+
+    @staticmethod
+    def _file2dict(filename, use_predefined_variables=True):
+        filename = osp.abspath(osp.expanduser(filename))
+        check_file_exist(filename)
+        fileExtname = osp.splitext(filename)[1]
+        if fileExtname not in ['.py', '.json', '.yaml', '.yml']:
+            raise IOError('Only py/yml/yaml/json type are supported now!')
+
+        cfg_dict, cfg_text = Config._parse_file_cached(filename, use_predefined_variables)
 
         if BASE_KEY in cfg_dict:
             cfg_dir = osp.dirname(filename)
@@ -266,8 +396,13 @@ class Config:
                 if len(b) <= k:
                     raise KeyError(f'Index {k} exceeds the length of list {b}')
                 b[k] = Config._merge_a_into_b(v, b[k], allow_list_keys)
-            elif isinstance(v,
-                            dict) and k in b and not v.pop(DELETE_KEY, False):
+            elif isinstance(v, dict) and k in b:
+                # strip the delete key without modifying ``a``
+                delete = v.get(DELETE_KEY, False)
+                v = {key: value for key, value in v.items() if key != DELETE_KEY}
+                if delete:
+                    b[k] = v
+                    continue
                 allowed_types = (dict, list) if allow_list_keys else dict
                 if not isinstance(b[k], allowed_types):
                     raise TypeError(
@@ -442,6 +577,9 @@ class Config:
                 r += '}'
             return r
 
+        # yapf is slow to import and only needed here
+        from yapf.yapflib.yapf_api import FormatCode
+
         cfg_dict = self._cfg_dict.to_dict()
         text = _format_dict(cfg_dict, outest_level=True)
         # copied from setup.cfg
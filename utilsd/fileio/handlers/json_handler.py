@@ -3,6 +3,11 @@ import json
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import BaseFileHandler
 
 
@@ -22,10 +27,21 @@ def set_default(obj):
     raise TypeError(f'{type(obj)} is unsupported for json dump')
 
 
+def json_loads(s):
+    """Same as ``json.loads``, but much faster if orjson is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson is stricter, e.g., NaN is not allowed
+            pass
+    return json.loads(s)
+
+
 class JsonHandler(BaseFileHandler):
 
     def load_from_fileobj(self, file):
-        return json.load(file)
+        return json_loads(file.read())
 
     def dump_to_fileobj(self, obj, file, **kwargs):
         kwargs.setdefault('default', set_default)
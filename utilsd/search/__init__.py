@@ -1,2 +1,2 @@
 from .confgen import offline_search
-from .space import Choice, sample_from, iterate_over, size
+from .space import Choice, sample_from, grid_sample_from, iterate_over, size
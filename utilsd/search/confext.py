@@ -5,6 +5,11 @@ import os
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 from ..fileio import load
 
 
@@ -63,6 +68,6 @@ if __name__ == '__main__':
     data = _eject_ordered_dict(data)
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
     with open(args.output, 'w') as f:
-        yaml.safe_dump(data, f)
+        yaml.dump(data, f, Dumper=SafeDumper)
 
     print(f'Saved config to {args.output}')
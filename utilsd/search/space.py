@@ -2,7 +2,7 @@ import abc
 import copy
 import itertools
 import random
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
 
 
 class Space(abc.ABC):
@@ -42,16 +42,8 @@ class Choice(Space):
 
 def size(space: Any):
     sz = 1
-    def _measure(space: Any):
-        nonlocal sz
-        if isinstance(space, Space):
-            sz *= len(space)
-        if isinstance(space, (tuple, list)):
-            [_measure(s) for s in space]
-        if isinstance(space, dict):
-            [_measure(s) for s in space.values()]
-
-    _measure(space)
+    for _, subspace in _flatten(space):
+        sz *= len(subspace)
     return sz
 
 
@@ -76,37 +68,64 @@ def sample_from(space: Any):
 
 
 def iterate_over(space: Any):
-    meta = {}
-    def _iterate(key: str, space: Any):
-        if isinstance(space, Space):
-            for sample in space:
-                meta[key] = sample
-                yield sample
-        elif isinstance(space, list):
-            for sample in _product(*[(_joinkey(key, i), s) for i, s in enumerate(space)]):
-                yield list(sample)
-        elif isinstance(space, tuple):
-            for sample in _product(*[(_joinkey(key, i), s) for i, s in enumerate(space)]):
-                yield tuple(sample)
-        elif isinstance(space, dict):
-            keys, values = list(zip(*space.items()))
-            for sample in _product(*[(_joinkey(key, k), s) for k, s in zip(keys, values)]):
-                yield dict(zip(keys, sample))
-        else:
-            yield space
-
-    def _product(*iterate_params):
-        if len(iterate_params) == 1:
-            for s in _iterate(*iterate_params[0]):
-                yield (s,)
-        else:
-            for s in _iterate(*iterate_params[0]):
-                for t in _product(*iterate_params[1:]):
-                    yield (s,) + t
-
-    for sample in _iterate('', space):
-        sample['_meta'] = copy.deepcopy(meta)
-        yield sample
+    leaves = _flatten(space)
+    keys = [key for key, _ in leaves]
+    # the first space changes the slowest, same as nested loops in depth-first order
+    for picked in itertools.product(*[subspace for _, subspace in leaves]):
+        yield _make_sample(space, keys, picked)
+
+
+def grid_sample_from(space: Any, k: int) -> List[Any]:
+    """Pick ``k`` distinct samples from :func:`iterate_over` at random (all of them if ``k`` is larger),
+    without enumerating all the samples in space.
+    """
+    leaves = _flatten(space)
+    keys = [key for key, _ in leaves]
+    choices = [list(subspace) for _, subspace in leaves]
+    total = size(space)
+    samples = []
+    for index in random.sample(range(total), min(k, total)):
+        # decode the index in the order of itertools.product, i.e., the last space changes the fastest
+        picked = []
+        for c in reversed(choices):
+            index, i = divmod(index, len(c))
+            picked.append(c[i])
+        samples.append(_make_sample(space, keys, picked[::-1]))
+    return samples
+
+
+def _make_sample(space: Any, keys: List[str], picked: Sequence[Any]) -> Any:
+    sample = _rebuild(space, iter(picked))
+    sample['_meta'] = copy.deepcopy(dict(zip(keys, picked)))
+    return sample
+
+
+def _flatten(space: Any, key: str = '', leaves: Optional[List[Tuple[str, Space]]] = None) -> List[Tuple[str, Space]]:
+    """Collect the spaces and their keys, in depth-first order."""
+    if leaves is None:
+        leaves = []
+    if isinstance(space, Space):
+        leaves.append((key, space))
+    elif isinstance(space, (list, tuple)):
+        for i, s in enumerate(space):
+            _flatten(s, _joinkey(key, i), leaves)
+    elif isinstance(space, dict):
+        for k, s in space.items():
+            _flatten(s, _joinkey(key, k), leaves)
+    return leaves
+
+
+def _rebuild(space: Any, picked: Iterator[Any]) -> Any:
+    """Replace the spaces with the picked values, which are in the order of :func:`_flatten`."""
+    if isinstance(space, Space):
+        return next(picked)
+    if isinstance(space, list):
+        return [_rebuild(s, picked) for s in space]
+    if isinstance(space, tuple):
+        return tuple([_rebuild(s, picked) for s in space])
+    if isinstance(space, dict):
+        return {k: _rebuild(v, picked) for k, v in space.items()}
+    return space
 
 
 def _joinkey(a, b):